@@ -10,9 +10,11 @@ This script systematically mines GitHub issues for OS-portability problems using
 Key Features:
 - Concept buckets: Organized keywords into semantic categories
 - Strict proximity gating: OS and FIX keywords must co-occur in the same sentence/line
-- Multithreaded processing: Scalable across many repositories
-- Caching: Avoids redundant API calls
-- AI validation: Optional post-processing with LLM for quality control
+- Multithreaded processing: Scalable across many repositories, with per-repo
+  concurrent comment fetching
+- Caching: Avoids redundant API calls (single SQLite issue cache, cache/issues.db)
+- AI validation: Optional post-processing with LLM for quality control,
+  batching several candidate issues per request
 
 Usage:
   python mining_issues_script.py --input repos.csv --output results.csv --workers 8 \\
@@ -42,13 +44,28 @@ import os
 import re
 import csv
 import sys
+import gzip
+import multiprocessing
+import sqlite3
+import queue
 import time
+import threading
 import argparse
-from typing import List, Dict, Iterable, Optional, Tuple
+import functools
+from typing import List, Dict, Iterable, Optional, Tuple, Callable
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import parse_qs, urlencode, urlsplit
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, 
+                                as_completed, wait)
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional, only used to parse JSON faster
+    orjson = None
 
 
 # -----------------------------
@@ -56,11 +73,66 @@ import requests
 # -----------------------------
 
 GITHUB_API_BASE = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_BASE}/graphql"
 USER_AGENT = "research-portability-mining/1.0"
 
 # Global GitHub request counter for statistics
 GLOBAL_REQUEST_COUNTER = [0]
 
+# Concurrent comment fetches per repository (in-flight requests per worker)
+COMMENT_FETCH_WORKERS = 8
+
+# Memoized keyword scans (repeated texts such as bot and template comments)
+SCAN_CACHE_SIZE = 4096
+
+# Concurrent page fetches once the page count of a listing is known
+PAGE_FETCH_WORKERS = 8
+
+# In-flight GitHub requests across all threads. Nested pools (repositories x
+# comments x pages) are capped here, below GitHub's limit of 100 concurrent
+# requests, so --workers can be raised without tripping secondary rate limits.
+GITHUB_MAX_IN_FLIGHT = 50
+GITHUB_IN_FLIGHT = threading.BoundedSemaphore(GITHUB_MAX_IN_FLIGHT)
+
+# Shared HTTP session: keeps TCP/TLS connections alive across API calls.
+# Pool size covers GITHUB_MAX_IN_FLIGHT connections per host; transient
+# gateway errors and dropped connections are retried at the transport level,
+# for GET only: POSTs such as OpenAI chat completions are billed and must not
+# be re-sent after a read timeout.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32, pool_maxsize=64, 
+    max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[502, 503, 504], 
+                      allowed_methods=frozenset({"GET"}), raise_on_status=False),
+))
+# GraphQL queries are read-only, so the GraphQL endpoint (the longest matching
+# mount prefix wins) also retries its POSTs
+HTTP_SESSION.mount(GITHUB_GRAPHQL_URL, HTTPAdapter(
+    pool_connections=1, pool_maxsize=64, 
+    max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[502, 503, 504], 
+                      allowed_methods=frozenset({"POST"}), raise_on_status=False),
+))
+
+# GitHub request timeouts in seconds: (connect, read)
+GITHUB_TIMEOUT = (5, 30)
+
+# Issue cache database (one SQLite file for all repositories)
+CACHE_DB_PATH = os.path.join("cache", "issues.db")
+
+# ETag cache of API pages: at most this many pages are kept, least recently
+# validated first out; pruned every HTTP_CACHE_PRUNE_EVERY stored pages
+HTTP_CACHE_MAX_ENTRIES = 50000
+HTTP_CACHE_PRUNE_EVERY = 1000
+
+# LLM validation: issues per OpenAI request, and concurrent requests per repository.
+# One issue per prompt is the published methodology; larger batches are opt-in
+# (--ai-batch-size) and change the prompt, so their results are not comparable.
+AI_BATCH_SIZE = 1
+AI_BATCH_WORKERS = 4
+
+# Upper bound on an OpenAI response body (answers are a few KB of JSON)
+OPENAI_MAX_RESPONSE_BYTES = 256 * 1024
+
 # Output CSV field names
 FIELDNAMES = [
     "repository", "type", "source", "keyword", "summary", "link",
@@ -131,64 +203,182 @@ CONCEPTS: Dict[str, List[str]] = {
 # Keyword Matching Logic
 # -----------------------------
 
-def compile_keyword_regexes(keywords: List[str]) -> List[Tuple[str, re.Pattern]]:
+def compile_keyword_literals(keywords: List[str]) -> List[Tuple[str, str, bool, bool]]:
     """
-    Compile keyword patterns with word boundary protection.
+    Prepare keywords for literal (substring) matching with word boundary protection.
     
     Strategy:
-    - For alphanumeric keywords: add word boundaries to avoid substring matches
+    - For alphanumeric keywords: require word boundaries to avoid substring matches
       (e.g., 'arch' won't match 'search')
     - For keywords with special chars: preserve literal matching
       (e.g., '.dll' matches 'file.dll')
+    
+    Returns:
+        List of (keyword, lowercased keyword, needs_left_boundary, needs_right_boundary)
+    """
+    return [
+        (kw, kw.lower(), kw[:1].isalnum(), kw[-1:].isalnum())
+        for kw in keywords
+    ]
+
+
+# Non-ASCII characters that case-insensitive regex matching treats as ASCII
+# letters (dotted/dotless i, long s, Kelvin sign); folded before lowercasing
+ASCII_CASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def lower_for_matching(text: str) -> str:
+    """Lowercase text for keyword matching, consistent with re.IGNORECASE."""
+    return text.translate(ASCII_CASE_FOLD).lower()
+
+
+def _is_word_char(ch: str) -> bool:
+    """Check if a character counts as part of a word for keyword boundaries."""
+    return ch.isascii() and (ch.isalnum() or ch == "_")
+
+
+def find_keyword(text_lower: str, kw_lower: str, left: bool, right: bool) -> bool:
+    """
+    Check if a lowercased keyword occurs in lowercased text at word boundaries.
+    
+    Uses str.find (C-level substring search) and only inspects the characters
+    around each candidate occurrence.
     """
-    pairs: List[Tuple[str, re.Pattern]] = []
-    for kw in keywords:
-        starts_with_alnum = kw[:1].isalnum()
-        ends_with_alnum = kw[-1:].isalnum()
-        left = r"(?<![A-Za-z0-9_])" if starts_with_alnum else ""
-        right = r"(?![A-Za-z0-9_])" if ends_with_alnum else ""
-        pattern = f"{left}{re.escape(kw)}{right}"
-        pairs.append((kw, re.compile(pattern, re.IGNORECASE)))
-    return pairs
+    size = len(kw_lower)
+    i = text_lower.find(kw_lower)
+    while i != -1:
+        if ((not left or i == 0 or not _is_word_char(text_lower[i - 1]))
+                and (not right or i + size >= len(text_lower)
+                     or not _is_word_char(text_lower[i + size]))):
+            return True
+        i = text_lower.find(kw_lower, i + 1)
+    return False
 
 
 # Special handling for "nt" (Windows OS name): only match when quoted or standalone
-# to avoid false positives (e.g., "important", "content")
-NT_QUOTED_RE = re.compile(r'"nt"', re.IGNORECASE)
-NT_STANDALONE_RE = re.compile(r'(?<!\S)nt(?!\S)', re.IGNORECASE)
+# to avoid false positives (e.g., "important", "content"). Applied to lowercased
+# text, so no case-insensitive matching is needed.
+NT_RE = re.compile(r'"nt"|(?<!\S)nt(?!\S)')
 
-# Pre-compile all concept patterns for efficiency
-COMPILED_CONCEPTS: Dict[str, List[Tuple[str, re.Pattern]]] = {
-    name: compile_keyword_regexes(kws)
+# Pre-compile all concept keywords for efficiency
+COMPILED_CONCEPTS: Dict[str, List[Tuple[str, str, bool, bool]]] = {
+    name: compile_keyword_literals(kws)
     for name, kws in CONCEPTS.items()
 }
 
 
-def match_concepts(text: str) -> Dict[str, List[str]]:
+def minimal_substring_set(keywords: Iterable[str]) -> Tuple[str, ...]:
     """
-    Match concept keywords in text and return hits organized by category.
+    Lowercase keywords and drop those containing another keyword as a substring.
     
-    Returns:
-        Dict mapping category names to lists of matched keywords
+    For plain substring tests the shorter keyword is found whenever the longer
+    one is (e.g. 'fix' covers 'fixed' and 'bugfix'), so the longer one is redundant.
+    """
+    lowered = {kw.lower() for kw in keywords}
+    return tuple(sorted(kw for kw in lowered 
+                        if not any(other != kw and other in kw for other in lowered)))
+
+
+# Cheap prefilter for proximity gating: plain substrings (no boundary checks)
+# of every OS and FIX keyword, plus "nt" delimited as it can be inside a sentence
+OS_GATE_LITERALS = minimal_substring_set(CONCEPTS["OS"])
+FIX_GATE_LITERALS = minimal_substring_set(CONCEPTS["FIX"])
+NT_GATE_RE = re.compile(r'"nt"|(?<![^\s.!?])nt(?![^\s.!?])')
+
+
+# Non-empty sentence/line fragments used by proximity gating; the separators
+# are ASCII, so fragment offsets are the same in the original and lowercased text
+FRAGMENT_RE = re.compile(r"[^.!?\n]+")
+
+
+def _match_literals(text_lower: str) -> Dict[str, List[Tuple[str, str, bool, bool]]]:
+    """
+    Return the keyword literals of each concept bucket found in lowercased text.
+    
+    Each keyword is located with its own str.find over the whole text, which
+    keeps the scan in C. A single Python-level pass dispatching on the first
+    character of each position (trie/startswith style) is about 10x slower,
+    and pruning keywords whose shorter substring is absent does not pay off
+    for the ~120 keywords used here.
+    """
+    matched: Dict[str, List[Tuple[str, str, bool, bool]]] = {}
+    for name, literals in COMPILED_CONCEPTS.items():
+        found = [lit for lit in literals if find_keyword(text_lower, lit[1], lit[2], lit[3])]
+        if found:
+            matched[name] = found
+    return matched
+
+
+def _has_nt(text_lower: str) -> bool:
+    """Check lowercased text for "nt" quoted or standalone (Windows OS name)."""
+    return NT_RE.search(text_lower) is not None
+
+
+@functools.lru_cache(maxsize=SCAN_CACHE_SIZE)
+def _scan_text_cached(text: str, check_proximity: bool) -> Tuple[Tuple[Tuple[str, Tuple[str, ...]], ...], bool]:
+    """
+    Match concept keywords and apply proximity gating in a single pass.
+    
+    Fragments are split at non-word characters, so a keyword found in a
+    fragment is also found in the whole text (except for the "nt" special
+    case). Fragments are therefore only checked for the OS/FIX keywords
+    already matched in the whole text instead of re-running every bucket.
+    
+    Memoized per text (bot and template comments repeat across issues), so
+    hits are returned as immutable (bucket, keywords) pairs.
     """
     hits: Dict[str, List[str]] = {}
     if not text:
-        return hits
+        return (), False
     
-    for name, pairs in COMPILED_CONCEPTS.items():
-        found: List[str] = []
-        for kw, rx in pairs:
-            if rx.search(text):
-                found.append(kw)
-        if found:
-            hits[name] = sorted(set(found))
+    text_lower = lower_for_matching(text)
+    matched = _match_literals(text_lower)
+    for name, found in matched.items():
+        hits[name] = sorted({lit[0] for lit in found})
     
     # Special case: add "nt" to OS category only when properly delimited
-    if NT_QUOTED_RE.search(text) or NT_STANDALONE_RE.search(text):
+    if _has_nt(text_lower):
         hits.setdefault("OS", []).append("nt")
         hits["OS"] = sorted(set(hits["OS"]))
     
-    return hits
+    local_ok = False
+    os_lits = matched.get("OS", [])
+    fix_lits = matched.get("FIX", [])
+    nt_possible = check_proximity and bool(fix_lits) and NT_GATE_RE.search(text_lower) is not None
+    if check_proximity and fix_lits and (os_lits or nt_possible):
+        # Fragments are produced lazily; the walk stops at the first co-occurrence
+        for frag_match in FRAGMENT_RE.finditer(text_lower):
+            frag_lower = frag_match.group()
+            if (any(find_keyword(frag_lower, kw_lower, left, right) for _, kw_lower, left, right in fix_lits)
+                    and (any(find_keyword(frag_lower, kw_lower, left, right) for _, kw_lower, left, right in os_lits)
+                         or (nt_possible and _has_nt(frag_lower)))):
+                local_ok = True
+                break
+    
+    return tuple((name, tuple(kws)) for name, kws in hits.items()), local_ok
+
+
+def scan_text(text: str, *, check_proximity: bool = True) -> Tuple[Dict[str, List[str]], bool]:
+    """
+    Match concept keywords and apply proximity gating in a single pass.
+    
+    Returns:
+        Tuple of (hits as returned by match_concepts,
+                  result of sentence_level_cooccurrence; False when
+                  check_proximity is disabled)
+    """
+    hits, local_ok = _scan_text_cached(text, check_proximity)
+    return {name: list(kws) for name, kws in hits}, local_ok
+
+
+def match_concepts(text: str) -> Dict[str, List[str]]:
+    """
+    Match concept keywords in text and return hits organized by category.
+    
+    Returns:
+        Dict mapping category names to lists of matched keywords
+    """
+    return scan_text(text, check_proximity=False)[0]
 
 
 def has_os_and_fix(hits: Dict[str, List[str]]) -> bool:
@@ -196,6 +386,23 @@ def has_os_and_fix(hits: Dict[str, List[str]]) -> bool:
     return bool(hits.get("OS")) and bool(hits.get("FIX"))
 
 
+@functools.lru_cache(maxsize=SCAN_CACHE_SIZE)
+def may_cooccur(text: str) -> bool:
+    """
+    Cheap necessary condition for sentence_level_cooccurrence.
+    
+    True when the text contains some OS and some FIX keyword as plain
+    substrings; texts failing this cannot pass proximity gating. Memoized
+    per text, like scan_text.
+    """
+    if not text:
+        return False
+    text_lower = lower_for_matching(text)
+    if not any(kw in text_lower for kw in FIX_GATE_LITERALS):
+        return False
+    return any(kw in text_lower for kw in OS_GATE_LITERALS) or bool(NT_GATE_RE.search(text_lower))
+
+
 def sentence_level_cooccurrence(text: str) -> bool:
     """
     Proximity gating: Check if OS and FIX keywords co-occur in the same sentence/line.
@@ -203,14 +410,9 @@ def sentence_level_cooccurrence(text: str) -> bool:
     This is critical for reducing false positives by ensuring the keywords
     appear in close proximity, not just anywhere in the document.
     """
-    if not text:
+    if not may_cooccur(text):
         return False
-    for frag in re.split(r"[\.!?\n]", text):
-        if not frag:
-            continue
-        if has_os_and_fix(match_concepts(frag)):
-            return True
-    return False
+    return scan_text(text)[1]
 
 
 def format_concept_hits(hits: Dict[str, List[str]]) -> str:
@@ -237,25 +439,140 @@ def sanitize_repo(owner_repo: str) -> str:
 
 
 def get_cache_paths(owner_repo: str) -> Tuple[str, str]:
-    """Get cache directory and file paths for a repository."""
+    """Get legacy (per-repository file) cache directory and file paths."""
     base = os.path.join("cache", "issues", sanitize_repo(owner_repo))
-    return base, os.path.join(base, "issues.jsonl")
+    return base, os.path.join(base, "issues.json.gz")
 
 
-def load_repo_cache(owner_repo: str) -> Optional[List[Dict]]:
-    """Load cached issue data for a repository if available."""
+_CACHE_DB_LOCAL = threading.local()
+
+# Connections released by finished threads, reused by new ones: the nested
+# page and comment pools start short-lived threads, which would otherwise
+# each open (and set up) a connection of their own
+_CACHE_DB_IDLE: List[Tuple[str, sqlite3.Connection]] = []
+_CACHE_DB_IDLE_LOCK = threading.Lock()
+_CACHE_DB_SCHEMA_READY: set = set()
+
+
+class _CacheDbLease:
+    """Thread-local holder that returns its connection to the idle list when the thread exits."""
+    
+    def __init__(self, path: str, conn: sqlite3.Connection):
+        self.path = path
+        self.conn = conn
+    
+    def __del__(self):
+        with _CACHE_DB_IDLE_LOCK:
+            _CACHE_DB_IDLE.append((self.path, self.conn))
+
+
+def get_cache_db() -> sqlite3.Connection:
+    """
+    Return this thread's connection to the issue cache database.
+    
+    WAL journaling lets repository threads read while another one writes;
+    synchronous=NORMAL is durable enough for a re-creatable cache.
+    A connection is held by one thread at a time; when the thread exits it
+    goes back to an idle list for the next thread instead of being reopened.
+    """
+    db_path = os.path.abspath(CACHE_DB_PATH)
+    lease = getattr(_CACHE_DB_LOCAL, "lease", None)
+    if lease is not None and lease.path == db_path:
+        return lease.conn
+    
+    conn = None
+    with _CACHE_DB_IDLE_LOCK:
+        for i, (path, _) in enumerate(_CACHE_DB_IDLE):
+            if path == db_path:
+                conn = _CACHE_DB_IDLE.pop(i)[1]
+                break
+    if conn is None:
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # Connections move between threads, but only one uses each at a time
+        conn = sqlite3.connect(db_path, timeout=60, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    if db_path not in _CACHE_DB_SCHEMA_READY:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS issues ("
+            " repo TEXT NOT NULL, number INTEGER NOT NULL, seq INTEGER NOT NULL, updated_at TEXT,"
+            " payload BLOB NOT NULL, comments BLOB NOT NULL,"
+            " PRIMARY KEY (repo, number))"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS repos ("
+            " repo TEXT PRIMARY KEY, etag TEXT, last_modified TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache ("
+            " url TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL,"
+            " links TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        conn.commit()
+        _CACHE_DB_SCHEMA_READY.add(db_path)
+    _CACHE_DB_LOCAL.lease = _CacheDbLease(db_path, conn)
+    return conn
+
+
+def compact_issue(detail: Dict) -> Dict:
+    """Keep only the issue fields consumed downstream (drops the bulky raw payload)."""
+    issue = {
+        "number": detail.get("number"),
+        "title": detail.get("title"),
+        "body": detail.get("body"),
+        "html_url": detail.get("html_url"),
+        "created_at": detail.get("created_at"),
+        "updated_at": detail.get("updated_at"),
+        "user": {"login": (detail.get("user") or {}).get("login")},
+        "labels": [{"name": lb.get("name", "")} for lb in (detail.get("labels") or [])],
+        "comments": detail.get("comments", 0),
+        "comments_url": detail.get("comments_url"),
+    }
+    if "pull_request" in detail:
+        issue["pull_request"] = {}
+    return issue
+
+
+def compact_comment(comment: Dict) -> Dict:
+    """Keep only the comment body, the one comment field consumed downstream."""
+    return {"body": comment.get("body")}
+
+
+def compact_record(rec: Dict) -> Dict:
+    """Project a {"issue", "comments"} record onto the fields consumed downstream."""
+    return {"issue": compact_issue(rec.get("issue") or {}), 
+            "comments": rec.get("comments") if isinstance(rec.get("comments"), list) else []}
+
+
+# GitHub payloads are parsed with orjson when it is installed (several times
+# faster than the stdlib parser); both accept the raw response bytes
+_decode_json = orjson.loads if orjson is not None else json.loads
+
+
+def _encode_json(value) -> bytes:
+    """Serialize a value as compact UTF-8 JSON for the cache database."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def load_legacy_repo_cache(owner_repo: str) -> Optional[List[Dict]]:
+    """Load a per-repository cache file written by earlier versions of this script."""
     try:
         cache_dir, cache_file = get_cache_paths(owner_repo)
-        if not os.path.exists(cache_file) or os.path.getsize(cache_file) == 0:
+        if os.path.exists(cache_file) and os.path.getsize(cache_file) > 0:
+            with open(cache_file, "rb") as f:
+                records = _decode_json(gzip.decompress(f.read()))
+            return records or None
+        legacy_file = os.path.join(cache_dir, "issues.jsonl")
+        if not os.path.exists(legacy_file) or os.path.getsize(legacy_file) == 0:
             return None
-        records: List[Dict] = []
-        with open(cache_file, "r", encoding="utf-8") as f:
+        records = []
+        with open(legacy_file, "r", encoding="utf-8") as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    records.append(json.loads(line))
+                    records.append(_decode_json(line))
                 except Exception:
                     continue
         return records or None
@@ -263,15 +580,142 @@ def load_repo_cache(owner_repo: str) -> Optional[List[Dict]]:
         return None
 
 
+def load_repo_cache(owner_repo: str) -> Optional[List[Dict]]:
+    """
+    Load cached issue data for a repository if available.
+    
+    Records come from the cache database in their cached order (most
+    recently updated first).
+    Repositories only present in a legacy per-repository cache file are
+    imported into the database on first use.
+    """
+    try:
+        rows = get_cache_db().execute(
+            "SELECT payload, comments FROM issues WHERE repo = ? ORDER BY seq", (owner_repo,)
+        ).fetchall()
+    except Exception:
+        return None
+    if not rows:
+        records = load_legacy_repo_cache(owner_repo)
+        if records:
+            save_repo_cache(owner_repo, records)
+        return records
+    return [{"issue": _decode_json(payload), "comments": _decode_json(comments)} 
+            for payload, comments in rows]
+
+
+def upsert_repo_cache(owner_repo: str, records: List[Dict], *, replace_all: bool = False) -> None:
+    """
+    Insert or update cached issues of a repository (keyed by issue number).
+    
+    Upserted records are ordered before the repository's other cached
+    issues, in the given order. With replace_all, issues of the repository
+    not in records are dropped.
+    """
+    try:
+        conn = get_cache_db()
+        with conn:
+            if replace_all:
+                conn.execute("DELETE FROM issues WHERE repo = ?", (owner_repo,))
+                first_seq = 0
+            else:
+                min_seq = conn.execute("SELECT MIN(seq) FROM issues WHERE repo = ?", 
+                                       (owner_repo,)).fetchone()[0]
+                first_seq = (min_seq or 0) - len(records)
+            rows = []
+            for offset, rec in enumerate(records):
+                compact = compact_record(rec)
+                issue = compact["issue"]
+                rows.append((owner_repo, issue["number"], first_seq + offset, issue.get("updated_at"), 
+                             _encode_json(issue), _encode_json(compact["comments"])))
+            conn.executemany(
+                "INSERT OR REPLACE INTO issues (repo, number, seq, updated_at, payload, comments) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+    except Exception:
+        pass
+
+
 def save_repo_cache(owner_repo: str, records: List[Dict]) -> None:
-    """Save issue data to cache for future runs."""
+    """Save issue data to cache for future runs (replaces the repository's cached issues)."""
+    upsert_repo_cache(owner_repo, records, replace_all=True)
+
+
+def load_repo_cache_meta(owner_repo: str) -> Dict[str, str]:
+    """Load conditional-request metadata (ETag, Last-Modified) for a cached repository."""
     try:
-        cache_dir, cache_file = get_cache_paths(owner_repo)
-        os.makedirs(cache_dir, exist_ok=True)
-        with open(cache_file, "w", encoding="utf-8") as f:
-            for rec in records:
-                f.write(json.dumps(rec, ensure_ascii=False))
-                f.write("\n")
+        row = get_cache_db().execute(
+            "SELECT etag, last_modified FROM repos WHERE repo = ?", (owner_repo,)
+        ).fetchone()
+    except Exception:
+        return {}
+    if not row:
+        return {}
+    return {"etag": row[0] or "", "last_modified": row[1] or ""}
+
+
+def save_repo_cache_meta(owner_repo: str, meta: Dict[str, str]) -> None:
+    """Save conditional-request metadata next to the cached issues."""
+    try:
+        conn = get_cache_db()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO repos (repo, etag, last_modified) VALUES (?, ?, ?)", 
+                (owner_repo, meta.get("etag", ""), meta.get("last_modified", ""))
+            )
+    except Exception:
+        pass
+
+
+def load_http_cache(key: str) -> Optional[Tuple[str, bytes, str]]:
+    """Load (etag, gzip-compressed items JSON, links JSON) of a cached API page."""
+    try:
+        row = get_cache_db().execute(
+            "SELECT etag, body, links FROM http_cache WHERE url = ?", (key,)
+        ).fetchone()
+    except Exception:
+        return None
+    return tuple(row) if row else None
+
+
+def touch_http_cache(key: str) -> None:
+    """Mark a cached API page as just revalidated, so eviction keeps it."""
+    try:
+        conn = get_cache_db()
+        with conn:
+            conn.execute("UPDATE http_cache SET fetched_at = ? WHERE url = ?", (time.time(), key))
+    except Exception:
+        pass
+
+
+_HTTP_CACHE_SAVES = [0]
+_HTTP_CACHE_SAVES_LOCK = threading.Lock()
+
+
+def save_http_cache(key: str, etag: str, items: List[Dict], links: str) -> None:
+    """
+    Store the (already projected) items of an API page under its request URL.
+    
+    Every HTTP_CACHE_PRUNE_EVERY saves, pages beyond HTTP_CACHE_MAX_ENTRIES
+    are evicted, least recently fetched or revalidated first.
+    """
+    with _HTTP_CACHE_SAVES_LOCK:
+        _HTTP_CACHE_SAVES[0] += 1
+        prune = _HTTP_CACHE_SAVES[0] % HTTP_CACHE_PRUNE_EVERY == 0
+    try:
+        conn = get_cache_db()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO http_cache (url, etag, body, links, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)", 
+                (key, etag, gzip.compress(_encode_json(items), compresslevel=3), links, time.time())
+            )
+            if prune:
+                conn.execute(
+                    "DELETE FROM http_cache WHERE url NOT IN "
+                    "(SELECT url FROM http_cache ORDER BY fetched_at DESC LIMIT ?)", 
+                    (HTTP_CACHE_MAX_ENTRIES,)
+                )
     except Exception:
         pass
 
@@ -319,14 +763,23 @@ def ensure_output_with_header(path: str) -> None:
             writer.writeheader()
 
 
-def append_rows(path: str, rows: Iterable[Dict]) -> None:
-    """Append result rows to output CSV."""
-    with open(path, "a", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-        for row in rows:
-            for k in FIELDNAMES:
-                row.setdefault(k, "")
-            writer.writerow(row)
+def csv_writer_loop(path: str, rows_queue: "queue.Queue[Optional[List[Dict]]]") -> None:
+    """
+    Append batches of result rows from rows_queue to the output CSV until a None sentinel.
+    
+    Runs in a dedicated thread that owns the file: it is opened once with a
+    large buffer, and flushed whenever the queue runs empty so partial
+    results reach disk during long runs.
+    """
+    with open(path, "a", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES, restval="")
+        while True:
+            batch = rows_queue.get()
+            if batch is None:
+                break
+            writer.writerows(batch)
+            if rows_queue.empty():
+                f.flush()
 
 
 def read_token_from_file() -> Optional[str]:
@@ -381,10 +834,76 @@ def read_openai_token() -> Optional[str]:
     return None
 
 
+class GitHubRateLimiter:
+    """
+    Token bucket pacing GitHub requests below the hourly rate limit.
+    
+    One bucket per rate-limit resource ("core" REST, "graphql"), refilled
+    continuously at limit/3600 tokens per second. Buckets are clamped to the
+    X-RateLimit-Limit/Remaining headers of each response, so workers slow
+    down before the quota runs out instead of stalling on 403s.
+    """
+    
+    def __init__(self, limit_per_hour: int = 5000):
+        self._lock = threading.Lock()
+        self._default_limit = float(limit_per_hour)
+        # resource -> [tokens, capacity, last refill time]
+        self._buckets: Dict[str, List[float]] = {}
+    
+    def _bucket(self, resource: str) -> List[float]:
+        bucket = self._buckets.get(resource)
+        now = time.monotonic()
+        if bucket is None:
+            bucket = self._buckets[resource] = [self._default_limit, self._default_limit, now]
+        else:
+            tokens, capacity, last = bucket
+            bucket[0] = min(capacity, tokens + (now - last) * capacity / 3600.0)
+            bucket[2] = now
+        return bucket
+    
+    def acquire(self, resource: str = "core", cost: float = 1.0) -> None:
+        """Block until cost tokens are available for resource, then take them."""
+        while True:
+            with self._lock:
+                bucket = self._bucket(resource)
+                if bucket[0] >= cost:
+                    bucket[0] -= cost
+                    return
+                wait_s = (cost - bucket[0]) * 3600.0 / bucket[1]
+            time.sleep(min(wait_s, 60.0))
+    
+    def update(self, resource: str, headers) -> None:
+        """Clamp the bucket to the quota reported in a response's headers."""
+        try:
+            limit = float(headers.get("X-RateLimit-Limit") or 0)
+            remaining = headers.get("X-RateLimit-Remaining")
+        except Exception:
+            return
+        with self._lock:
+            bucket = self._bucket(resource)
+            if limit > 0:
+                bucket[1] = limit
+            if remaining is not None:
+                try:
+                    bucket[0] = min(bucket[0], float(remaining))
+                except ValueError:
+                    pass
+
+
+# Shared by all worker threads
+RATE_LIMITER = GitHubRateLimiter()
+
+
+@functools.lru_cache(maxsize=4)
 def get_github_headers(token: Optional[str]) -> Dict[str, str]:
-    """Construct GitHub API request headers."""
+    """
+    Construct GitHub API request headers.
+    
+    Memoized per token: the returned dict is shared and must not be modified.
+    """
     headers = {
         "Accept": "application/vnd.github+json",
+        "Accept-Encoding": "gzip",
         "User-Agent": USER_AGENT,
     }
     if token:
@@ -394,24 +913,70 @@ def get_github_headers(token: Optional[str]) -> Dict[str, str]:
 
 def github_request(method: str, url: str, *, token: Optional[str], 
                    params: Optional[Dict[str, str]] = None, 
+                   json_body: Optional[Dict] = None, 
+                   extra_headers: Optional[Dict[str, str]] = None, 
                    request_counter: Optional[List[int]] = None) -> requests.Response:
     """
     Make GitHub API request with automatic retry and rate limit handling.
+    
+    Requests are paced by RATE_LIMITER; 403/429 responses carrying
+    Retry-After (secondary rate limits) are retried after that delay.
+    A 304 response (conditional request via extra_headers) is returned as-is.
+    
+    304 responses do not count against GitHub's rate limit, so conditional
+    requests are not paced up front: they take a limiter token and are
+    counted only once the response turns out not to be a 304.
     """
     headers = get_github_headers(token)
+    if extra_headers:
+        headers = {**headers, **extra_headers}
+    resource = "graphql" if url == GITHUB_GRAPHQL_URL else "core"
+    conditional = bool(extra_headers) and ("If-None-Match" in extra_headers 
+                                           or "If-Modified-Since" in extra_headers)
     backoff = 2.0
+    last_error = ""
     
-    for _ in range(6):
+    def count_request() -> None:
         if request_counter is not None:
             request_counter[0] += 1
         try:
             GLOBAL_REQUEST_COUNTER[0] += 1
         except Exception:
             pass
-        
-        resp = requests.request(method, url, headers=headers, params=params)
+    
+    for _ in range(6):
+        if not conditional:
+            RATE_LIMITER.acquire(resource)
+        try:
+            with GITHUB_IN_FLIGHT:
+                resp = HTTP_SESSION.request(method, url, headers=headers, params=params, 
+                                            json=json_body, timeout=GITHUB_TIMEOUT)
+        except requests.RequestException as e:
+            # Timeouts / connection errors that outlived the transport retries
+            count_request()
+            last_error = f"{type(e).__name__}: {e}"
+            time.sleep(backoff)
+            backoff = min(backoff * 2.0, 60.0)
+            continue
+        RATE_LIMITER.update(resource, resp.headers)
+        if resp.status_code == 304:
+            # Served from the ETag cache: free on GitHub's side
+            return resp
+        count_request()
+        if conditional:
+            RATE_LIMITER.acquire(resource)
+        last_error = f"{resp.status_code}: {resp.text[:200]}"
         
         # Handle rate limiting
+        retry_after = resp.headers.get("Retry-After")
+        if resp.status_code in (403, 429) and retry_after and retry_after.isdigit():
+            # Secondary rate limit: GitHub tells how long to wait
+            wait_s = max(int(retry_after), backoff)
+            print(f"[rate-limit] Retry-After {wait_s}s...", file=sys.stderr)
+            time.sleep(wait_s)
+            backoff = min(backoff * 2.0, 60.0)
+            continue
+        
         if resp.status_code == 403 and resp.headers.get("X-RateLimit-Remaining") == "0":
             reset_ts = int(resp.headers.get("X-RateLimit-Reset", "0"))
             wait_s = max(0, reset_ts - int(time.time()) + 2)
@@ -426,33 +991,314 @@ def github_request(method: str, url: str, *, token: Optional[str],
         time.sleep(backoff)
         backoff = min(backoff * 2.0, 60.0)
     
-    raise RuntimeError(f"GitHub API error {resp.status_code}: {resp.text[:200]}")
+    raise RuntimeError(f"GitHub API error {last_error}")
+
+
+def cached_github_get(url: str, *, token: Optional[str], 
+                      project: Callable[[Dict], Dict], 
+                      params: Optional[Dict] = None, 
+                      request_counter: Optional[List[int]] = None) -> Tuple[List[Dict], Dict]:
+    """
+    GET a page of a GitHub API listing through the persistent ETag cache.
+    
+    Only the ETag and the page's items, reduced by project to the fields
+    consumed downstream, are stored. Previously seen URLs are requested with
+    If-None-Match; a 304 (which does not count against the rate limit)
+    returns the cached items.
+    
+    Returns:
+        Tuple of (projected items, pagination links as in requests' Response.links)
+    """
+    key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+    cached = load_http_cache(key)
+    resp = github_request("GET", url, token=token, params=params, 
+                          extra_headers={"If-None-Match": cached[0]} if cached else None, 
+                          request_counter=request_counter)
+    if resp.status_code == 304 and cached:
+        touch_http_cache(key)
+        items = [project(item) for item in _page_items(_decode_json(gzip.decompress(cached[1])))]
+        return items, json.loads(cached[2])
+    
+    items = [project(item) for item in _page_items(_decode_json(resp.content))]
+    etag = resp.headers.get("ETag")
+    if etag:
+        save_http_cache(key, etag, items, json.dumps(resp.links or {}))
+    return items, (resp.links or {})
+
+
+def _page_items(body) -> List[Dict]:
+    """Extract the list of items from a (possibly search-style) API page."""
+    if not isinstance(body, list):
+        body = body.get("items", [])
+    return body
+
+
+def _last_page_number(links: Dict) -> Optional[int]:
+    """Read the total page count from the rel="last" Link header, if present."""
+    last_url = ((links or {}).get("last") or {}).get("url")
+    if not last_url:
+        return None
+    try:
+        return int(parse_qs(urlsplit(last_url).query)["page"][0])
+    except (KeyError, IndexError, ValueError):
+        return None
 
 
 def paginated_get(url: str, *, token: Optional[str], 
+                  project: Callable[[Dict], Dict], 
                   params: Optional[Dict[str, str]] = None, 
                   request_counter: Optional[List[int]] = None) -> Iterable[Dict]:
     """
     Fetch paginated results from GitHub API.
     
-    Yields individual items from paginated API responses.
-    """
-    page = 1
-    while True:
-        merged_params = dict(params or {})
-        merged_params.update({"per_page": 100, "page": page})
-        resp = github_request("GET", url, token=token, params=merged_params, 
-                            request_counter=request_counter)
-        items = resp.json()
-        if not isinstance(items, list):
-            items = items.get("items", [])
+    Yields individual items, reduced by project, from paginated API
+    responses; pages go through the ETag cache (cached_github_get). The
+    first page's rel="last" Link header gives the page count, so the remaining pages are
+    fetched concurrently (PAGE_FETCH_WORKERS) and yielded in order. Otherwise
+    pages are followed one at a time while the rel="next" link is present.
+    """
+    base_params = dict(params or {})
+    base_params["per_page"] = 100
+    
+    def _get_page(page: int) -> Tuple[List[Dict], Dict]:
+        return cached_github_get(url, token=token, project=project, 
+                                 params={**base_params, "page": page}, 
+                                 request_counter=request_counter)
+    
+    items, first_links = _get_page(1)
+    if not items:
+        return
+    yield from items
+    
+    last_page = _last_page_number(first_links)
+    if last_page is not None:
+        if last_page > 1:
+            with ThreadPoolExecutor(max_workers=min(PAGE_FETCH_WORKERS, last_page - 1)) as pool:
+                for items, _ in pool.map(_get_page, range(2, last_page + 1)):
+                    yield from items
+        return
+    
+    # No rel="last": walk pages while the previous one links a rel="next",
+    # which also avoids requesting an empty page past the end
+    page, links = 2, first_links
+    while "next" in links:
+        items, links = _get_page(page)
         if not items:
             break
-        for it in items:
-            yield it
+        yield from items
         page += 1
 
 
+# GraphQL page sizes: comments per issue go up to the connection maximum (100)
+# so that few issues need the REST fallback; issues per page stay at 50 to keep
+# responses well within GitHub's GraphQL timeout for comment-heavy repositories.
+GRAPHQL_ISSUES_PER_PAGE = 50
+GRAPHQL_COMMENTS_PER_ISSUE = 100
+
+# GraphQL query returning a page of issues together with their first comments.
+# Pull requests are not part of the `issues` connection, so no filtering is needed.
+# Actor logins go through graphql_login; comments are fetched as bodies only,
+# like the REST fallback, so no comment author can differ between the paths.
+ISSUES_GRAPHQL_QUERY = """
+query($owner: String!, $name: String!, $cursor: String, $since: DateTime,
+      $issues: Int!, $comments: Int!) {
+  repository(owner: $owner, name: $name) {
+    issues(first: $issues, after: $cursor, orderBy: {field: UPDATED_AT, direction: DESC},
+           filterBy: {since: $since}) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        number title body createdAt updatedAt url
+        author { __typename login }
+        labels(first: 20) { nodes { name } }
+        comments(first: $comments) { totalCount pageInfo { hasNextPage endCursor } nodes { body } }
+      }
+    }
+  }
+}
+"""
+
+
+def graphql_login(actor: Optional[Dict]) -> str:
+    """
+    Map a GraphQL actor to the login the REST API reports for it.
+    
+    GraphQL leaves the "[bot]" suffix off app logins and returns a null actor
+    for deleted accounts, which REST reports as "ghost".
+    """
+    if not actor:
+        return "ghost"
+    login = actor.get("login") or "ghost"
+    if actor.get("__typename") == "Bot" and not login.endswith("[bot]"):
+        login += "[bot]"
+    return login
+
+
+def graphql_fetch_issues(owner_repo: str, token: str, cursor: Optional[str], *, 
+                         since_iso: Optional[str] = None, 
+                         request_counter: Optional[List[int]] = None
+                         ) -> Tuple[List[Dict], Optional[str], bool]:
+    """
+    Fetch one page of issues (with their first comments) via GitHub GraphQL v4.
+    
+    Each record has the same {"issue": ..., "comments": [...]} shape as the REST
+    path; the issue dict mirrors the REST fields consumed downstream. Records
+    whose comments did not fit in the first page carry "comments_truncated".
+    
+    Returns:
+        Tuple of (records, end_cursor, has_next_page)
+    """
+    owner, name = owner_repo.split("/", 1)
+    payload = {
+        "query": ISSUES_GRAPHQL_QUERY,
+        "variables": {"owner": owner, "name": name, "cursor": cursor, "since": since_iso, 
+                      "issues": GRAPHQL_ISSUES_PER_PAGE, "comments": GRAPHQL_COMMENTS_PER_ISSUE},
+    }
+    resp = github_request("POST", GITHUB_GRAPHQL_URL, token=token, json_body=payload, 
+                          request_counter=request_counter)
+    data = _decode_json(resp.content)
+    if data.get("errors") and not data.get("data"):
+        raise RuntimeError(f"GitHub GraphQL error: {str(data['errors'])[:200]}")
+    
+    issues = (((data.get("data") or {}).get("repository") or {}).get("issues") or {})
+    page_info = issues.get("pageInfo") or {}
+    records: List[Dict] = []
+    for node in issues.get("nodes") or []:
+        comments = node.get("comments") or {}
+        number = node.get("number")
+        detail = {
+            "number": number,
+            "title": node.get("title"),
+            "body": node.get("body"),
+            "html_url": node.get("url"),
+            "created_at": node.get("createdAt"),
+            "updated_at": node.get("updatedAt"),
+            "user": {"login": graphql_login(node.get("author"))},
+            "labels": [{"name": lb.get("name", "")} for lb in ((node.get("labels") or {}).get("nodes") or [])],
+            "comments": comments.get("totalCount", 0),
+            "comments_url": f"{GITHUB_API_BASE}/repos/{owner_repo}/issues/{number}/comments",
+        }
+        records.append({
+            "issue": detail,
+            "comments": [(c.get("body") or "") for c in (comments.get("nodes") or [])],
+            "comments_truncated": bool((comments.get("pageInfo") or {}).get("hasNextPage")),
+        })
+    return records, page_info.get("endCursor"), bool(page_info.get("hasNextPage"))
+
+
+def fetch_issue_comments(detail: Dict, *, token: Optional[str], 
+                         request_counter: Optional[List[int]] = None) -> List[str]:
+    """Fetch all comment bodies of an issue via REST pagination."""
+    if detail.get("comments", 0) > 0 and detail.get("comments_url"):
+        comments_json = list(paginated_get(detail.get("comments_url"), 
+                                          token=token, project=compact_comment, params=None, 
+                                          request_counter=request_counter))
+        return [(c.get("body") or "") for c in comments_json]
+    return []
+
+
+def fetch_repo_records(owner_repo: str, token: Optional[str], *, 
+                       since_iso: Optional[str] = None, 
+                       request_counter: Optional[List[int]] = None) -> List[Dict]:
+    """
+    Fetch issues (most recently updated first) with their comments.
+    
+    Uses GraphQL when a token is available, REST otherwise. When since_iso is
+    given, only issues updated at or after that timestamp are returned.
+    
+    Returns:
+        List of {"issue": ..., "comments": [...]} records
+    """
+    def _fetch_comments(detail: Dict) -> List[str]:
+        return fetch_issue_comments(detail, token=token, request_counter=request_counter)
+    
+    fetched_records: List[Dict] = []
+    if token:
+        # GraphQL returns issues and their first comments in one request
+        cursor: Optional[str] = None
+        has_next = True
+        while has_next:
+            page_records, cursor, has_next = graphql_fetch_issues(
+                owner_repo, token, cursor, since_iso=since_iso, 
+                request_counter=request_counter)
+            fetched_records.extend(page_records)
+        
+        # Fall back to REST pagination only for comment-heavy issues
+        truncated: List[Dict] = []
+        for rec in fetched_records:
+            if rec.pop("comments_truncated", False):
+                truncated.append(rec)
+        if truncated:
+            with ThreadPoolExecutor(max_workers=COMMENT_FETCH_WORKERS) as pool:
+                for rec, comments_bodies in zip(truncated, pool.map(
+                        _fetch_comments, [rec["issue"] for rec in truncated])):
+                    rec["comments"] = comments_bodies
+    else:
+        # GraphQL requires authentication; use the REST endpoints
+        base_url = f"{GITHUB_API_BASE}/repos/{owner_repo}/issues"
+        list_params = {"state": "all", "sort": "updated", "direction": "desc", "per_page": 100}
+        if since_iso:
+            list_params["since"] = since_iso
+        issues: List[Dict] = []
+        
+        for detail in paginated_get(base_url, token=token, project=compact_issue, 
+                                   params=list_params, request_counter=request_counter):
+            # Skip pull requests (GitHub API returns both)
+            if "pull_request" in detail:
+                continue
+            issues.append(detail)
+        
+        # Fetch comments for all issues concurrently (network latency dominates)
+        with ThreadPoolExecutor(max_workers=COMMENT_FETCH_WORKERS) as pool:
+            all_comments = list(pool.map(_fetch_comments, issues))
+        
+        fetched_records = [
+            {"issue": detail, "comments": comments_bodies}
+            for detail, comments_bodies in zip(issues, all_comments)
+        ]
+    return fetched_records
+
+
+def refresh_repo_records(owner_repo: str, token: Optional[str], cached: List[Dict], *, 
+                         request_counter: Optional[List[int]] = None) -> List[Dict]:
+    """
+    Incrementally refresh cached issue records.
+    
+    1. Conditional GET (If-None-Match / If-Modified-Since) of the first issues
+       page; since issues are sorted by update time, a 304 means nothing
+       changed, and 304 responses do not count against the rate limit
+    2. Otherwise fetch only issues updated since the newest cached issue and
+       merge them into the cache by issue number
+    """
+    meta = load_repo_cache_meta(owner_repo)
+    conditional: Dict[str, str] = {}
+    if meta.get("etag"):
+        conditional["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        conditional["If-Modified-Since"] = meta["last_modified"]
+    
+    resp = github_request("GET", f"{GITHUB_API_BASE}/repos/{owner_repo}/issues", token=token, 
+                          params={"state": "all", "sort": "updated", "direction": "desc", 
+                                  "per_page": 100, "page": 1}, 
+                          extra_headers=conditional, request_counter=request_counter)
+    if resp.status_code == 304:
+        return cached
+    
+    since_iso = max((str((rec.get("issue") or {}).get("updated_at") or "") for rec in cached), 
+                    default="") or None
+    changed = fetch_repo_records(owner_repo, token, since_iso=since_iso, 
+                                 request_counter=request_counter)
+    changed_numbers = {(rec.get("issue") or {}).get("number") for rec in changed}
+    records = changed + [rec for rec in cached 
+                         if (rec.get("issue") or {}).get("number") not in changed_numbers]
+    
+    upsert_repo_cache(owner_repo, changed)
+    save_repo_cache_meta(owner_repo, {
+        "etag": resp.headers.get("ETag", ""),
+        "last_modified": resp.headers.get("Last-Modified", ""),
+    })
+    return records
+
+
 # -----------------------------
 # LLM Validation (Optional)
 # -----------------------------
@@ -487,24 +1333,70 @@ def build_ai_prompt(owner_repo: str, issue_number: int, title: str,
     return instructions + "\nINPUT:\n" + json.dumps(context, ensure_ascii=False)
 
 
-def call_openai_analyze(token: str, model: str, prompt: str, *, 
-                       logs_dir: Optional[str] = None, 
-                       log_name: Optional[str] = None) -> Dict[str, str]:
+def build_ai_batch_prompt(owner_repo: str, issues: List[Dict]) -> str:
     """
-    Call OpenAI API for LLM-based validation.
+    Construct a single prompt validating several issues of one repository.
     
-    Returns structured analysis results including confidence scores.
+    Each entry in issues carries the issue number and the same title/body/comments
+    context as build_ai_prompt; the model answers with one result per issue.
     """
-    url = "https://api.openai.com/v1/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
+    context = {
+        "repo": owner_repo,
+        "issues": [
+            {
+                "id": int(it["number"]),
+                "title": it.get("title") or "",
+                "body": (it.get("body") or "")[:8000],  # Limit length for API constraints
+                "comments": [c[:2000] for c in (it.get("comments") or [])][:10],
+            }
+            for it in issues
+        ],
+    }
+    instructions = (
+        "You are an expert triaging GitHub issues for OS-dependent test failures and portability fixes.\n"
+        "Given the list of issues below, answer strictly in JSON as an object with a single key "
+        "'results' holding one object per issue, with these keys: \n"
+        "- id: the issue id from the input\n"
+        "- ai_issue_summary: a 3-10 word summary of the issue (no punctuation except spaces). "
+        "If not portability, briefly say what it is instead.\n"
+        "- ai_is_os_portability: 'Yes' or 'No' (is this about OS portability / tests failing "
+        "on one OS and not others, or OS-specific behavior)\n"
+        "- ai_is_fix_merged: 'Yes' or 'No' (based on the text, has a fix been merged/resolved; "
+        "if unclear, answer 'No')\n"
+        "- ai_confidence_pct: integer 0-100 for your confidence in 'ai_is_os_portability'\n"
+        "Judge every issue independently. Respond with ONLY a single-line JSON object.\n"
+    )
+    return instructions + "\nINPUT:\n" + json.dumps(context, ensure_ascii=False)
+
+
+# Conservative defaults used when the LLM answer cannot be parsed
+AI_FALLBACK_FIELDS = {
+    "ai_issue_summary": "",
+    "ai_is_os_portability": "No",
+    "ai_is_fix_merged": "No",
+    "ai_confidence_pct": "0",
+}
+
+
+def normalize_ai_fields(parsed: Dict) -> Dict[str, str]:
+    """Convert one parsed LLM answer into the AI output columns."""
+    # Enforce word limit on summary
+    raw_summary = str(parsed.get("ai_issue_summary", "")).strip()
+    words = [w for w in raw_summary.split() if w]
+    summary_10 = " ".join(words[:10])
+    
+    return {
+        "ai_issue_summary": summary_10,
+        "ai_is_os_portability": "Yes" if str(parsed.get("ai_is_os_portability", "No")).strip().lower().startswith("y") else "No",
+        "ai_is_fix_merged": "Yes" if str(parsed.get("ai_is_fix_merged", "No")).strip().lower().startswith("y") else "No",
+        "ai_confidence_pct": (lambda v: str(min(100, max(0, v))))(
+            (lambda s: int(s) if s.isdigit() else 0)(str(parsed.get("ai_confidence_pct", "0")).strip())
+        ),
     }
 
-    def _request(payload: Dict) -> requests.Response:
-        return requests.post(url, headers=headers, json=payload, timeout=60)
 
-    # Prepare logging
+def _ai_log_writer(logs_dir: Optional[str], log_name: Optional[str]) -> Callable[[str], None]:
+    """Return a function appending lines to logs_dir/log_name (no-op without a path)."""
     log_path: Optional[str] = None
     if logs_dir and log_name:
         try:
@@ -524,6 +1416,33 @@ def call_openai_analyze(token: str, model: str, prompt: str, *,
         except Exception:
             pass
 
+    return _append_log
+
+
+def read_capped_body(resp: requests.Response, limit: int) -> bytes:
+    """Read a streamed response body, raising RuntimeError if it exceeds limit bytes."""
+    chunks: List[bytes] = []
+    size = 0
+    for chunk in resp.iter_content(chunk_size=8192):
+        size += len(chunk)
+        if size > limit:
+            raise RuntimeError(f"Response body exceeds {limit} bytes")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def openai_chat_json(token: str, model: str, prompt: str, *, 
+                     append_log: Callable[[str], None]) -> str:
+    """
+    Send a JSON-mode chat completion request and return the raw answer text.
+    
+    Raises RuntimeError on HTTP errors.
+    """
+    url = "https://api.openai.com/v1/chat/completions"
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
     payload = {
         "model": model,
         "messages": [
@@ -533,63 +1452,154 @@ def call_openai_analyze(token: str, model: str, prompt: str, *,
         "response_format": {"type": "json_object"},
     }
 
-    _append_log("--- BEGIN REQUEST ---")
-    _append_log(f"model={model}")
-    _append_log("PROMPT:\n" + prompt)
+    append_log("--- BEGIN REQUEST ---")
+    append_log(f"model={model}")
+    append_log("PROMPT:\n" + prompt)
     
-    resp = _request(payload)
+    # Stream the body so an unexpectedly large answer is rejected, not buffered
+    resp = HTTP_SESSION.post(url, headers=headers, json=payload, timeout=60, stream=True)
+    try:
+        raw = read_capped_body(resp, OPENAI_MAX_RESPONSE_BYTES)
+    finally:
+        resp.close()
+    resp_text = raw.decode("utf-8", errors="replace")
     
-    _append_log("--- BEGIN RESPONSE ---")
-    _append_log(f"HTTP {resp.status_code}")
-    _append_log((resp.text or "")[:5000])
-    _append_log("--- END RESPONSE ---")
+    append_log("--- BEGIN RESPONSE ---")
+    append_log(f"HTTP {resp.status_code}")
+    append_log(resp_text[:5000])
+    append_log("--- END RESPONSE ---")
 
     if resp.status_code >= 300:
-        raise RuntimeError(f"OpenAI API error {resp.status_code}: {resp.text[:200]}")
+        raise RuntimeError(f"OpenAI API error {resp.status_code}: {resp_text[:200]}")
+
+    data = json.loads(raw)
+    return (((data.get("choices") or [{}])[0].get("message") or {}).get("content") or "").strip()
 
-    data = resp.json()
-    text = (((data.get("choices") or [{}])[0].get("message") or {}).get("content") or "").strip()
+
+def call_openai_analyze(token: str, model: str, prompt: str, *, 
+                       logs_dir: Optional[str] = None, 
+                       log_name: Optional[str] = None) -> Dict[str, str]:
+    """
+    Call OpenAI API for LLM-based validation.
+    
+    Returns structured analysis results including confidence scores.
+    """
+    append_log = _ai_log_writer(logs_dir, log_name)
+    text = openai_chat_json(token, model, prompt, append_log=append_log)
 
     # Parse JSON response
     try:
-        parsed = json.loads(text)
-        # Enforce word limit on summary
-        raw_summary = str(parsed.get("ai_issue_summary", "")).strip()
-        words = [w for w in raw_summary.split() if w]
-        summary_10 = " ".join(words[:10])
-        
-        out = {
-            "ai_issue_summary": summary_10,
-            "ai_is_os_portability": "Yes" if str(parsed.get("ai_is_os_portability", "No")).strip().lower().startswith("y") else "No",
-            "ai_is_fix_merged": "Yes" if str(parsed.get("ai_is_fix_merged", "No")).strip().lower().startswith("y") else "No",
-            "ai_confidence_pct": (lambda v: str(min(100, max(0, v))))(
-                (lambda s: int(s) if s.isdigit() else 0)(str(parsed.get("ai_confidence_pct", "0")).strip())
-            ),
-        }
-        _append_log("--- PARSED ---")
-        _append_log(json.dumps(out, ensure_ascii=False))
-        _append_log("--- END REQUEST ---")
+        out = normalize_ai_fields(json.loads(text))
+        append_log("--- PARSED ---")
+        append_log(json.dumps(out, ensure_ascii=False))
+        append_log("--- END REQUEST ---")
         return out
     except Exception:
         # Return conservative defaults on parse failure
-        fallback = {
-            "ai_issue_summary": "",
-            "ai_is_os_portability": "No",
-            "ai_is_fix_merged": "No",
-            "ai_confidence_pct": "0",
-        }
-        _append_log("--- PARSED (FALLBACK) ---")
-        _append_log(json.dumps(fallback, ensure_ascii=False))
-        _append_log("--- END REQUEST ---")
+        fallback = dict(AI_FALLBACK_FIELDS)
+        append_log("--- PARSED (FALLBACK) ---")
+        append_log(json.dumps(fallback, ensure_ascii=False))
+        append_log("--- END REQUEST ---")
         return fallback
 
 
+def call_openai_analyze_batch(token: str, model: str, owner_repo: str, 
+                              issues: List[Dict], *, 
+                              logs_dir: Optional[str] = None, 
+                              log_name: Optional[str] = None) -> Dict[int, Dict[str, str]]:
+    """
+    Validate several issues of one repository with a single OpenAI request.
+    
+    Returns a mapping issue number -> analysis fields. Issues missing from
+    the answer (or an unparsable answer) get the conservative defaults.
+    """
+    append_log = _ai_log_writer(logs_dir, log_name)
+    prompt = build_ai_batch_prompt(owner_repo, issues)
+    text = openai_chat_json(token, model, prompt, append_log=append_log)
+
+    out: Dict[int, Dict[str, str]] = {}
+    try:
+        parsed = json.loads(text)
+        results = parsed.get("results") if isinstance(parsed, dict) else parsed
+        for item in results or []:
+            try:
+                out[int(item.get("id"))] = normalize_ai_fields(item)
+            except Exception:
+                continue
+    except Exception:
+        out = {}
+    
+    missing = [int(it["number"]) for it in issues if int(it["number"]) not in out]
+    for number in missing:
+        out[number] = dict(AI_FALLBACK_FIELDS)
+    
+    append_log("--- PARSED (FALLBACK for %s) ---" % ",".join(map(str, missing)) if missing else "--- PARSED ---")
+    append_log(json.dumps(out, ensure_ascii=False))
+    append_log("--- END REQUEST ---")
+    return out
+
+
+# Placeholder AI columns for rows not validated by the LLM
+EMPTY_AI_FIELDS = {"ai_issue_summary": "", "ai_is_os_portability": "", 
+                   "ai_is_fix_merged": "", "ai_confidence_pct": ""}
+
+
+def run_ai_validation(owner_repo: str, candidates: List[Tuple[Dict, Dict]], *, 
+                      ai_token: str, ai_model: str, 
+                      batch_size: int = AI_BATCH_SIZE) -> Tuple[Dict[int, Dict[str, str]], int, int]:
+    """
+    Validate a repository's candidate issues with the LLM.
+    
+    candidates holds (issue detail, scan enrichment) pairs. Issues are sent
+    in batches of batch_size per request, with up to AI_BATCH_WORKERS
+    requests in flight; batch_size <= 1 keeps the one-prompt-per-issue mode.
+    
+    Returns:
+        Tuple of (issue number -> AI fields, ai_calls_count, ai_errors_count)
+    """
+    safe_repo = sanitize_repo(owner_repo)
+    issues = [
+        {"number": int(detail.get("number")), **enriched["enrichment_input"]}
+        for detail, enriched in candidates
+    ]
+    
+    def _analyze(batch: List[Dict]) -> Dict[int, Dict[str, str]]:
+        if len(batch) == 1 and batch_size <= 1:
+            it = batch[0]
+            prompt = build_ai_prompt(owner_repo, it["number"], it["title"], it["body"], it["comments"])
+            log_name = f"{safe_repo}_issue_{it['number']}.log"
+            return {it["number"]: call_openai_analyze(ai_token, ai_model, prompt, 
+                                                      logs_dir="logs", log_name=log_name)}
+        log_name = f"{safe_repo}_issues_{batch[0]['number']}-{batch[-1]['number']}.log"
+        return call_openai_analyze_batch(ai_token, ai_model, owner_repo, batch, 
+                                         logs_dir="logs", log_name=log_name)
+    
+    step = max(1, batch_size)
+    batches = [issues[i:i + step] for i in range(0, len(issues), step)]
+    results: Dict[int, Dict[str, str]] = {}
+    ai_calls = 0
+    ai_errors = 0
+    with ThreadPoolExecutor(max_workers=AI_BATCH_WORKERS) as pool:
+        futures = {pool.submit(_analyze, batch): batch for batch in batches}
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                results.update(future.result())
+                ai_calls += 1
+            except Exception as e:
+                numbers = ",".join(str(it["number"]) for it in batch)
+                print(f"[ai-error] {owner_repo}#{numbers}: {e}", file=sys.stderr)
+                ai_errors += len(batch)
+    return results, ai_calls, ai_errors
+
+
 # -----------------------------
 # Issue Scanning Logic
 # -----------------------------
 
 def sentence_level_artifact_scan(owner_repo: str, detail: Dict, *, 
-                                preloaded_comments: Optional[List[str]] = None) -> Optional[Dict]:
+                                preloaded_comments: Optional[List[str]] = None, 
+                                max_chars: int = 0) -> Optional[Dict]:
     """
     Scan issue for OS-portability keywords with proximity gating.
     
@@ -597,8 +1607,20 @@ def sentence_level_artifact_scan(owner_repo: str, detail: Dict, *,
     1. Check title/body first (fast path)
     2. If no match, check including comments (complete path)
     
+    When max_chars > 0, only the first max_chars characters of each text are
+    scanned (bounds the cost of pathologically long bodies/comments).
+    
     Returns enrichment data if issue passes filters, None otherwise.
     """
+    def _window(text: str) -> str:
+        return text[:max_chars] if max_chars > 0 else text
+    
+    # Cheap gate: without a text holding both OS and FIX keywords, proximity
+    # gating cannot pass (most issues are unrelated to OS portability)
+    if not any(may_cooccur(_window(text)) for text in
+               [detail.get("title") or "", detail.get("body") or ""] + list(preloaded_comments or [])):
+        return None
+    
     # Phase 1: Quick check with title/body only
     text_blobs_tb: List[Tuple[str, str]] = [
         ("title", detail.get("title") or ""), 
@@ -609,13 +1631,12 @@ def sentence_level_artifact_scan(owner_repo: str, detail: Dict, *,
     local_ok_tb = False
     
     for source, text in text_blobs_tb:
-        hits = match_concepts(text)
+        hits, ok = scan_text(_window(text), check_proximity=not local_ok_tb)
         if hits:
             for k, vals in hits.items():
                 aggregated_hits_tb.setdefault(k, []).extend(vals)
             source_parts_tb.append(source)
-        if not local_ok_tb and sentence_level_cooccurrence(text):
-            local_ok_tb = True
+        local_ok_tb = local_ok_tb or ok
 
     # If title/body already passes filters, return early
     if aggregated_hits_tb and local_ok_tb and has_os_and_fix({k: sorted(set(v)) for k, v in aggregated_hits_tb.items()}):
@@ -642,13 +1663,12 @@ def sentence_level_artifact_scan(owner_repo: str, detail: Dict, *,
     local_ok = local_ok_tb
     
     for source, text in text_blobs[2:]:  # Only new comments
-        hits = match_concepts(text)
+        hits, ok = scan_text(_window(text), check_proximity=not local_ok)
         if hits:
             for k, vals in hits.items():
                 aggregated_hits.setdefault(k, []).extend(vals)
             source_parts.append(source)
-        if not local_ok and sentence_level_cooccurrence(text):
-            local_ok = True
+        local_ok = local_ok or ok
 
     # Final filtering
     if not aggregated_hits or not local_ok or not has_os_and_fix({k: sorted(set(v)) for k, v in aggregated_hits.items()}):
@@ -668,14 +1688,91 @@ def sentence_level_artifact_scan(owner_repo: str, detail: Dict, *,
     }
 
 
+_REPO_LOCKS: Dict[str, threading.Lock] = {}
+_REPO_LOCKS_GUARD = threading.Lock()
+
+
+def _repo_lock(owner_repo: str) -> threading.Lock:
+    """Return the lock serializing cache loads/fetches of one repository."""
+    with _REPO_LOCKS_GUARD:
+        return _REPO_LOCKS.setdefault(owner_repo, threading.Lock())
+
+
+def load_repo_records(owner_repo: str, token: Optional[str], *, 
+                      since_iso: Optional[str], refresh_cache: bool = False, 
+                      request_counter: Optional[List[int]] = None) -> List[Dict]:
+    """
+    Load a repository's issue records from cache, fetching them when missing.
+    
+    Cached repositories are used as-is unless refresh_cache is set, in which
+    case only issues changed since the cached copy are re-fetched. Calls for
+    the same repository are serialized, so a repository listed several times
+    in the input is fetched once and then served from the cache.
+    """
+    with _repo_lock(owner_repo):
+        cached = load_repo_cache(owner_repo)
+        if cached is None:
+            records = fetch_repo_records(owner_repo, token, since_iso=since_iso, 
+                                         request_counter=request_counter)
+            save_repo_cache(owner_repo, records)
+            return records
+        if refresh_cache:
+            return refresh_repo_records(owner_repo, token, cached, 
+                                        request_counter=request_counter)
+        return cached
+
+
+def scan_records(owner_repo: str, records: List[Dict], *, 
+                 max_chars: int = 0) -> List[Tuple[Dict, Dict]]:
+    """
+    Apply keyword and proximity filters to a repository's issue records.
+    
+    CPU-bound and free of shared state, so it can run in a worker process.
+    max_chars caps the scanned length of each text (0: no limit).
+    
+    Returns:
+        List of (issue detail, enrichment) pairs for the issues passing the filters
+    """
+    candidates: List[Tuple[Dict, Dict]] = []
+    for rec in records:
+        detail = rec.get("issue") or {}
+        
+        # Skip pull requests
+        if "pull_request" in detail:
+            continue
+        
+        preloaded_comments: Optional[List[str]] = rec.get("comments") if isinstance(rec.get("comments"), list) else []
+        
+        # Apply keyword and proximity filters
+        enriched = sentence_level_artifact_scan(owner_repo, detail, 
+                                               preloaded_comments=preloaded_comments, 
+                                               max_chars=max_chars)
+        if not enriched:
+            continue
+        
+        candidates.append((detail, enriched))
+    return candidates
+
+
 def process_repo(owner_repo: str, token: Optional[str], *, 
                 ai_token: Optional[str], ai_model: str, 
                 max_issues: int, since_iso: Optional[str], 
                 fetch_comments: bool, always_fetch_comments: bool, 
-                max_comments: int) -> Tuple[List[Dict], int, int, int]:
+                max_comments: int, 
+                refresh_cache: bool = False, 
+                ai_batch_size: int = AI_BATCH_SIZE, 
+                scan_pool: Optional[ProcessPoolExecutor] = None, 
+                max_scan_chars: int = 0) -> Tuple[List[Dict], int, int, int]:
     """
     Process a single repository: fetch issues, apply filters, optionally validate with LLM.
     
+    Cached repositories are used as-is unless refresh_cache is set, in which
+    case only issues changed since the cached copy are re-fetched. Candidate
+    issues are validated with the LLM in batches of ai_batch_size per request.
+    When scan_pool is given, the CPU-bound scan runs in that process pool so
+    that it does not hold the GIL of the fetching threads. max_scan_chars caps
+    the scanned length of each issue text (0: no limit).
+    
     Returns:
         Tuple of (result_rows, ai_calls_count, ai_errors_count, github_requests_count)
     """
@@ -686,72 +1783,26 @@ def process_repo(owner_repo: str, token: Optional[str], *,
     request_counter: List[int] = [0]
     
     try:
-        # Try cache first
-        cached = load_repo_cache(owner_repo)
-        if cached is None:
-            # Fetch from GitHub API
-            base_url = f"{GITHUB_API_BASE}/repos/{owner_repo}/issues"
-            list_params = {"state": "all", "sort": "updated", "direction": "desc", "per_page": 100}
-            fetched_records: List[Dict] = []
-            
-            for detail in paginated_get(base_url, token=token, params=list_params, 
-                                       request_counter=request_counter):
-                # Skip pull requests (GitHub API returns both)
-                if "pull_request" in detail:
-                    continue
-                
-                # Fetch comments for each issue
-                comments_bodies: List[str] = []
-                if detail.get("comments", 0) > 0 and detail.get("comments_url"):
-                    comments_json = list(paginated_get(detail.get("comments_url"), 
-                                                      token=token, params=None, 
-                                                      request_counter=request_counter))
-                    comments_bodies = [(c.get("body") or "") for c in comments_json]
-                
-                fetched_records.append({
-                    "issue": detail,
-                    "comments": comments_bodies,
-                })
-            
-            save_repo_cache(owner_repo, fetched_records)
-            records = fetched_records
+        records = load_repo_records(owner_repo, token, since_iso=since_iso, 
+                                    refresh_cache=refresh_cache, 
+                                    request_counter=request_counter)
+
+        # Scan issues (in the process pool when available)
+        if scan_pool is not None:
+            candidates = scan_pool.submit(scan_records, owner_repo, records, 
+                                          max_chars=max_scan_chars).result()
         else:
-            records = cached
+            candidates = scan_records(owner_repo, records, max_chars=max_scan_chars)
 
-        # Process each issue
-        count_issues = 0
-        for rec in records:
-            detail = rec.get("issue") or {}
-            
-            # Skip pull requests
-            if "pull_request" in detail:
-                continue
-            
-            preloaded_comments: Optional[List[str]] = rec.get("comments") if isinstance(rec.get("comments"), list) else []
-            
-            # Apply keyword and proximity filters
-            enriched = sentence_level_artifact_scan(owner_repo, detail, 
-                                                   preloaded_comments=preloaded_comments)
-            if not enriched:
-                continue
-            
-            # Optional: LLM validation for quality assurance
-            ai_fields = {"ai_issue_summary": "", "ai_is_os_portability": "", 
-                        "ai_is_fix_merged": "", "ai_confidence_pct": ""}
-            if ai_token:
-                try:
-                    prompt = build_ai_prompt(owner_repo, int(detail.get("number")), 
-                                           enriched["enrichment_input"]["title"], 
-                                           enriched["enrichment_input"]["body"], 
-                                           enriched["enrichment_input"]["comments"])
-                    safe_repo = owner_repo.replace("/", "_")
-                    log_name = f"{safe_repo}_issue_{detail.get('number')}.log"
-                    ai_fields = call_openai_analyze(ai_token, ai_model, prompt, 
-                                                   logs_dir="logs", log_name=log_name)
-                    ai_calls += 1
-                except Exception as e:
-                    print(f"[ai-error] {owner_repo}#{detail.get('number')}: {e}", file=sys.stderr)
-                    ai_errors += 1
+        # Optional: LLM validation for quality assurance
+        ai_results: Dict[int, Dict[str, str]] = {}
+        if ai_token and candidates:
+            ai_results, ai_calls, ai_errors = run_ai_validation(
+                owner_repo, candidates, ai_token=ai_token, ai_model=ai_model, 
+                batch_size=ai_batch_size)
+
+        for detail, enriched in candidates:
+            ai_fields = ai_results.get(detail.get("number"), dict(EMPTY_AI_FIELDS))
             
             # Construct result row
             out.append({
@@ -768,7 +1819,6 @@ def process_repo(owner_repo: str, token: Optional[str], *,
                 "labels": ",".join([lb.get("name", "") for lb in (detail.get("labels") or [])]),
                 **ai_fields,
             })
-            count_issues += 1
             
     except Exception as e:
         print(f"[error] {owner_repo}: {e}", file=sys.stderr)
@@ -815,6 +1865,19 @@ Note: API tokens can also be provided via environment variables (GITHUB_TOKEN, O
                        help="OpenAI model for validation (default: gpt-4o-mini)")
     parser.add_argument("--openai-token", default="", 
                        help="OpenAI API key for validation (optional; or use env: OPENAI_API_KEY)")
+    parser.add_argument("--refresh-cache", action="store_true", 
+                       help="Incrementally refresh cached repositories using conditional requests "
+                            "(default: reuse cached issues as-is)")
+    parser.add_argument("--ai-batch-size", type=int, default=AI_BATCH_SIZE, 
+                       help=f"Issues validated per OpenAI request (default: {AI_BATCH_SIZE}, "
+                            "one prompt per issue as in the published methodology; larger "
+                            "batches are cheaper but their AI fields are not comparable)")
+    parser.add_argument("--scan-processes", type=int, default=0, 
+                       help="Worker processes for the CPU-bound keyword scan "
+                            "(default: 0, scan in the repository threads)")
+    parser.add_argument("--max-scan-chars", type=int, default=0, 
+                       help="Only scan the first N characters of each title/body/comment "
+                            "(default: 0, scan full texts)")
     
     args = parser.parse_args()
 
@@ -850,13 +1913,49 @@ Note: API tokens can also be provided via environment variables (GITHUB_TOKEN, O
     else:
         print(f"[start] LLM validation disabled (no OpenAI token provided)")
     
+    # A single writer thread owns the output file
+    rows_queue: "queue.Queue[Optional[List[Dict]]]" = queue.Queue(maxsize=64)
+    writer_errors: List[BaseException] = []
+    
+    def run_writer() -> None:
+        try:
+            csv_writer_loop(args.output, rows_queue)
+        except BaseException as exc:
+            # Recorded for the main thread, which re-raises it
+            writer_errors.append(exc)
+    
+    writer_thread = threading.Thread(target=run_writer, name="csv-writer", daemon=True)
+    writer_thread.start()
+    
+    def put_rows(batch: Optional[List[Dict]]) -> bool:
+        """Queue a batch for the writer; False if the writer has died (the queue no longer drains)."""
+        while writer_thread.is_alive():
+            try:
+                rows_queue.put(batch, timeout=1.0)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def writer_failure() -> RuntimeError:
+        cause = writer_errors[0] if writer_errors else None
+        error = RuntimeError(f"CSV writer for {args.output} stopped: {cause!r}")
+        error.__cause__ = cause
+        return error
+
     # Process repositories in parallel
-    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
-        future_to_repo = {
-            executor.submit(
+    # CPU-bound scanning optionally runs in worker processes (not limited by the GIL)
+    # Workers are spawned rather than forked: by now the writer thread is
+    # running and the repository threads will hold sqlite, HTTP and print
+    # locks that a forked child could inherit in the locked state
+    scan_pool = (ProcessPoolExecutor(max_workers=args.scan_processes, 
+                                     mp_context=multiprocessing.get_context("spawn"))
+                 if args.scan_processes > 0 else None)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+            run_repo = functools.partial(
                 process_repo,
-                repo,
-                token,
+                token=token,
                 ai_token=ai_token,
                 ai_model=ai_model,
                 max_issues=0,
@@ -864,29 +1963,54 @@ Note: API tokens can also be provided via environment variables (GITHUB_TOKEN, O
                 fetch_comments=True,
                 always_fetch_comments=True,
                 max_comments=-1,
-            ): repo
-            for repo in repos
-        }
-        
-        for future in as_completed(future_to_repo):
-            repo = future_to_repo[future]
-            rows: List[Dict] = []
-            ai_calls = 0
-            ai_errors = 0
-            gh_requests = 0
+                refresh_cache=args.refresh_cache,
+                ai_batch_size=args.ai_batch_size,
+                scan_pool=scan_pool,
+                max_scan_chars=args.max_scan_chars,
+            )
+            # Keep only a small window of repositories in flight, so pending
+            # futures (and their result rows) do not grow with the input size
+            repo_iter = iter(repos)
+            future_to_repo: Dict[object, str] = {}
             
-            try:
-                rows, ai_calls, ai_errors, gh_requests = future.result()
-            except Exception as exc:
-                print(f"[error] {repo}: {exc}", file=sys.stderr)
-                rows = []
+            def submit_next() -> None:
+                repo = next(repo_iter, None)
+                if repo is not None:
+                    future_to_repo[executor.submit(run_repo, repo)] = repo
             
-            append_rows(args.output, rows)
-            total_rows += len(rows)
-            
-            # Progress reporting
-            print(f"[done] {repo}: wrote {len(rows)} rows | "
-                  f"ai_calls={ai_calls} ai_errors={ai_errors} github_requests={gh_requests}")
+            for _ in range(max(1, args.workers) * 2):
+                submit_next()
+        
+            while future_to_repo:
+                done, _ = wait(future_to_repo, return_when=FIRST_COMPLETED)
+                for future in done:
+                    repo = future_to_repo.pop(future)
+                    submit_next()
+                    rows: List[Dict] = []
+                    ai_calls = 0
+                    ai_errors = 0
+                    gh_requests = 0
+                
+                    try:
+                        rows, ai_calls, ai_errors, gh_requests = future.result()
+                    except Exception as exc:
+                        print(f"[error] {repo}: {exc}", file=sys.stderr)
+                        rows = []
+                
+                    if not put_rows(rows):
+                        raise writer_failure()
+                    total_rows += len(rows)
+                
+                    # Progress reporting
+                    print(f"[done] {repo}: wrote {len(rows)} rows | "
+                          f"ai_calls={ai_calls} ai_errors={ai_errors} github_requests={gh_requests}")
+    finally:
+        if scan_pool is not None:
+            scan_pool.shutdown()
+        put_rows(None)
+        writer_thread.join()
+    if writer_errors:
+        raise writer_failure()
 
     print(f"\n[finish] Total rows written: {total_rows}")
     print(f"[finish] Output: {args.output}")
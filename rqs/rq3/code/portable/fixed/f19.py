@@ -19,9 +19,18 @@ class NetworkService:
         self.running = False
         
     def find_available_port(self, start_port=8080, max_attempts=100):
+        if start_port is None:
+            # Any free port will do: port 0 lets the OS hand out an ephemeral
+            # port in one bind instead of probing a range
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.bind((self.host, 0))
+                return s.getsockname()[1]
+        
         for port in range(start_port, start_port + max_attempts):
             try:
                 with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                    if os.name != 'nt':
+                        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
                     s.bind((self.host, port))
                     return port
             except OSError:
@@ -1,17 +1,29 @@
 import os
 import sys
+import errno
+import stat
+import functools
 import shutil
 import zipfile
 import tarfile
 import tempfile
 import hashlib
+import mmap
 import mimetypes
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import platform
 import subprocess
 from typing import List, Optional, Dict
 
 
+@functools.lru_cache(maxsize=1024)
+def _guess_mime_type(suffixes: str) -> Optional[str]:
+    # guess_type only looks at the extensions, so cache on those rather than
+    # on the full path
+    return mimetypes.guess_type("file" + suffixes)[0]
+
+
 class FileSystemUtils:
     def __init__(self):
         self.temp_dir = self._get_temp_directory()
@@ -45,23 +57,23 @@ class FileSystemUtils:
     
     def get_file_info(self, file_path: Path) -> Dict:
         try:
-            stat = file_path.stat()
+            st = file_path.stat()
+            is_file = stat.S_ISREG(st.st_mode)
             
             info = {
                 "path": str(file_path),
                 "name": file_path.name,
-                "size": stat.st_size,
-                "modified": stat.st_mtime,
-                "is_file": file_path.is_file(),
-                "is_dir": file_path.is_dir(),
+                "size": st.st_size,
+                "modified": st.st_mtime,
+                "is_file": is_file,
+                "is_dir": stat.S_ISDIR(st.st_mode),
                 "executable": os.access(file_path, os.X_OK),
                 "readable": os.access(file_path, os.R_OK),
                 "writable": os.access(file_path, os.W_OK)
             }
             
-            if file_path.is_file():
-                mime_type, _ = mimetypes.guess_type(str(file_path))
-                info["mime_type"] = mime_type
+            if is_file:
+                info["mime_type"] = _guess_mime_type("".join(file_path.suffixes))
                 info["extension"] = file_path.suffix
             
             return info
@@ -69,12 +81,34 @@ class FileSystemUtils:
         except OSError as e:
             return {"error": str(e), "path": str(file_path)}
     
+    # Files above this are hashed in blocks so a 32-bit process never tries to
+    # map more address space than it has
+    MMAP_MAX_SIZE = 1 << 30
+    
     def compute_file_hash(self, file_path: Path, algorithm='sha256') -> Optional[str]:
         try:
-            hash_func = hashlib.new(algorithm)
-            
             with open(file_path, 'rb') as f:
-                while chunk := f.read(8192):
+                # Python 3.11+: hashing loop runs in C with a large buffer
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, algorithm).hexdigest()
+                
+                hash_func = hashlib.new(algorithm)
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return hash_func.hexdigest()
+                
+                if size <= self.MMAP_MAX_SIZE:
+                    # Hand the whole mapped file to the hash in one call
+                    try:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            hash_func.update(mm)
+                        return hash_func.hexdigest()
+                    except (OSError, ValueError, OverflowError):
+                        # Not mappable (special file, address space exhausted)
+                        pass
+                
+                # Large or unmappable files: read in 1 MiB blocks
+                while chunk := f.read(1 << 20):
                     hash_func.update(chunk)
             
             return hash_func.hexdigest()
@@ -83,8 +117,23 @@ class FileSystemUtils:
             print(f"Error computing hash for {file_path}: {e}")
             return None
     
+    def compute_file_hashes(self, paths: List[Path], algorithm='sha256', 
+                            workers: Optional[int] = None) -> Dict[Path, Optional[str]]:
+        # hashlib releases the GIL while digesting large buffers, so threads
+        # hash separate files in parallel
+        paths = list(paths)
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            hashes = executor.map(lambda p: self.compute_file_hash(p, algorithm), paths)
+            return dict(zip(paths, hashes))
+    
+    # Formats that are already compressed; deflating them again only costs CPU
+    COMPRESSED_SUFFIXES = {
+        '.gz', '.tgz', '.bz2', '.xz', '.zst', '.zip', '.7z', '.jar', '.whl',
+        '.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp3', '.mp4', '.webm', '.mkv'
+    }
+    
     def create_archive(self, source_path: Path, archive_path: Path, 
-                      compression: str = 'auto') -> bool:
+                      compression: str = 'auto', compresslevel: int = 6) -> bool:
         try:
             if compression == 'auto':
                 if archive_path.suffix.lower() == '.zip':
@@ -95,18 +144,29 @@ class FileSystemUtils:
                     compression = 'zip'
             
             if compression == 'zip':
-                with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+                def _compress_type(file_path: Path) -> int:
+                    if file_path.suffix.lower() in self.COMPRESSED_SUFFIXES:
+                        return zipfile.ZIP_STORED
+                    return zipfile.ZIP_DEFLATED
+                
+                with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED, 
+                                     compresslevel=compresslevel) as zf:
                     if source_path.is_file():
-                        zf.write(source_path, source_path.name)
+                        zf.write(source_path, source_path.name, 
+                                 compress_type=_compress_type(source_path))
                     else:
                         for file_path in source_path.rglob('*'):
                             if file_path.is_file():
                                 relative_path = file_path.relative_to(source_path)
-                                zf.write(file_path, relative_path)
+                                zf.write(file_path, relative_path, 
+                                         compress_type=_compress_type(file_path))
             
             elif compression == 'tar':
-                mode = 'w:gz' if archive_path.suffix in ['.tgz', '.tar.gz'] else 'w'
-                with tarfile.open(archive_path, mode) as tf:
+                if archive_path.suffix in ['.tgz', '.tar.gz']:
+                    tf = tarfile.open(archive_path, 'w:gz', compresslevel=compresslevel)
+                else:
+                    tf = tarfile.open(archive_path, 'w')
+                with tf:
                     tf.add(source_path, arcname=source_path.name)
             
             return True
@@ -133,11 +193,18 @@ class FileSystemUtils:
             
             elif archive_path.suffix.lower() in ['.tar', '.tgz', '.tar.gz']:
                 with tarfile.open(archive_path, 'r:*') as tf:
-                    # Security check for path traversal
-                    for member in tf.getmembers():
-                        if os.path.isabs(member.name) or ".." in member.name:
-                            raise ValueError(f"Unsafe path in archive: {member.name}")
-                    tf.extractall(extract_to)
+                    if hasattr(tarfile, 'data_filter'):
+                        # Python 3.12+ (and security backports): the 'data' filter
+                        # rejects traversal, absolute paths, unsafe links and devices
+                        tf.extractall(extract_to, filter='data')
+                    else:
+                        # Security check for path traversal; extractall sets
+                        # directory attributes after all files are written
+                        members = tf.getmembers()
+                        for member in members:
+                            if os.path.isabs(member.name) or ".." in member.name:
+                                raise ValueError(f"Unsafe path in archive: {member.name}")
+                        tf.extractall(extract_to, members=members)
             
             return extract_to
             
@@ -167,10 +234,14 @@ class FileSystemUtils:
         try:
             dst.parent.mkdir(parents=True, exist_ok=True)
             
+            if dst.is_dir():
+                dst = dst / src.name
+            
+            self._copy_file_contents(src, dst)
             if preserve_metadata:
-                shutil.copy2(src, dst)
+                shutil.copystat(src, dst)
             else:
-                shutil.copy(src, dst)
+                shutil.copymode(src, dst)
             
             return True
             
@@ -178,6 +249,36 @@ class FileSystemUtils:
             print(f"Error copying {src} to {dst}: {e}")
             return False
     
+    def _copy_file_contents(self, src: Path, dst: Path):
+        # Opening dst for writing would truncate src before it is read
+        if dst.exists() and os.path.samefile(src, dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        
+        # copy_file_range keeps the data in the kernel and lets filesystems
+        # that support it (btrfs, XFS) share extents instead of copying
+        if not hasattr(os, 'copy_file_range'):
+            shutil.copyfile(src, dst)
+            return
+        
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            copied = 0
+            try:
+                while True:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+                    if n == 0:
+                        break
+                    copied += n
+            except OSError as e:
+                # Unsupported here (old kernel, cross-device, special file)
+                if copied or e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL):
+                    raise
+            
+            # procfs/sysfs-style files report 0 on the first call even though
+            # they have data; copy those through userspace (a no-op when the
+            # file really is empty)
+            if not copied:
+                shutil.copyfileobj(fsrc, fdst, 1 << 20)
+    
     def get_disk_usage(self, path: Path) -> Dict:
         try:
             if os.name == 'nt':
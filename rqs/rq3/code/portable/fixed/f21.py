@@ -1,3 +1,4 @@
+import getpass
 import os
 import subprocess
 import sys
@@ -31,9 +32,10 @@ def run_command(command):
 
 def get_current_user():
     """Get current username in a cross-platform way"""
-    username = run_command('whoami' if os.name != 'nt' else 'echo %USERNAME%')
-    
-    if not username:
+    try:
+        # Reads LOGNAME/USER/LNAME/USERNAME, then the password database on POSIX
+        username = getpass.getuser()
+    except (ImportError, KeyError, OSError):
         username = os.environ.get('USER') or os.environ.get('USERNAME')
     
     return username or 'unknown'
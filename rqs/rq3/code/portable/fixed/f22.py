@@ -1,9 +1,22 @@
+import functools
 import os
+import random
 import tempfile
 import time
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=None)
+def _get_lock_dir():
+    # Resolved and created once per process rather than once per lock object
+    if os.name != 'nt' and os.access("/var/lock", os.W_OK):
+        return Path("/var/lock")
+    
+    lock_dir = Path(tempfile.gettempdir()) / "locks"
+    lock_dir.mkdir(exist_ok=True)
+    return lock_dir
+
+
 class CrossPlatformLock:
     def __init__(self, name):
         self.name = name
@@ -11,39 +24,48 @@ class CrossPlatformLock:
         self.acquired = False
     
     def _get_lock_path(self):
-        if os.name == 'nt':
-            lock_dir = Path(tempfile.gettempdir()) / "locks"
-        else:
-            lock_dir = Path("/var/lock") if os.path.exists("/var/lock") else Path(tempfile.gettempdir()) / "locks"
-        
-        lock_dir.mkdir(exist_ok=True)
-        return lock_dir / f"{self.name}.lock"
+        return _get_lock_dir() / f"{self.name}.lock"
     
     def acquire(self, timeout=5):
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            try:
-                if not self.lock_file.exists():
-                    self.lock_file.write_text(str(os.getpid()))
-                    self.acquired = True
-                    return True
-                
-                time.sleep(0.1)
-            except OSError:
-                time.sleep(0.1)
+        deadline = time.monotonic() + timeout
+        delay = 0.001
         
-        return False
-    
-    def release(self):
-        if self.acquired and self.lock_file.exists():
+        while True:
             try:
-                self.lock_file.unlink()
-                self.acquired = False
+                # O_EXCL makes the existence check and the create one atomic step
+                fd = os.open(str(self.lock_file), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+                try:
+                    os.write(fd, str(os.getpid()).encode())
+                finally:
+                    os.close(fd)
+                self.acquired = True
                 return True
             except OSError:
                 pass
-        return False
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            # Exponential backoff with jitter, capped at 50 ms
+            time.sleep(min(delay + random.random() * delay, remaining))
+            delay = min(delay * 2, 0.05)
+    
+    def release(self):
+        if not self.acquired:
+            return False
+        
+        # unlink() reports a missing file itself, no exists() check needed
+        try:
+            self.lock_file.unlink()
+        except FileNotFoundError:
+            # Someone else removed the lock file; there is nothing left to hold
+            self.acquired = False
+            return False
+        except OSError:
+            return False
+        
+        self.acquired = False
+        return True
 
 
 if __name__ == "__main__":
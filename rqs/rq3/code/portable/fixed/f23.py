@@ -1,11 +1,15 @@
+import functools
 import os
 import sys
-import importlib.util
+import tempfile
+import types
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_dir():
     """Get application config directory based on platform"""
+    # Resolved and created once per process; later calls skip the mkdir
     if os.name == 'nt':
         config_base = os.environ.get('APPDATA', Path.home() / 'AppData' / 'Roaming')
     else:
@@ -16,22 +20,39 @@ def get_config_dir():
     return config_dir
 
 
+# Loaded config modules keyed by resolved path, stored as (mtime, size, module);
+# a changed file is reloaded and replaces its entry
+_CONFIG_CACHE = {}
+
+
 def load_config_module(config_path):
     """Dynamically load configuration module"""
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except OSError:
         return None
     
+    key = str(config_path.resolve())
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    
     try:
-        spec = importlib.util.spec_from_file_location("config", config_path)
-        config_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(config_module)
-        return config_module
+        code = compile(config_path.read_bytes(), str(config_path), 'exec')
+        config_module = types.ModuleType("config")
+        config_module.__file__ = str(config_path)
+        exec(code, config_module.__dict__)
     except Exception:
+        _CONFIG_CACHE.pop(key, None)
         return None
+    
+    _CONFIG_CACHE[key] = (st.st_mtime_ns, st.st_size, config_module)
+    return config_module
 
 
-def get_default_config():
-    """Default configuration with platform-specific paths"""
+@functools.lru_cache(maxsize=1)
+def _default_config():
+    # Built once; call _default_config.cache_clear() after changing TMPDIR
     return {
         'log_level': 'INFO',
         'max_workers': os.cpu_count() or 4,
@@ -40,20 +61,55 @@ def get_default_config():
     }
 
 
+def get_default_config():
+    """Default configuration with platform-specific paths"""
+    # A copy, so callers cannot modify the cached defaults
+    return dict(_default_config())
+
+
 def save_default_config():
     """Create default config file if it doesn't exist"""
     config_dir = get_config_dir()
     config_file = config_dir / 'config.py'
     
-    if not config_file.exists():
-        default_config = get_default_config()
-        config_content = f"""# Auto-generated configuration
+    default_config = get_default_config()
+    config_content = f"""# Auto-generated configuration
 LOG_LEVEL = '{default_config['log_level']}'
 MAX_WORKERS = {default_config['max_workers']}
 TEMP_DIR = r'{default_config['temp_dir']}'
 LINE_ENDING = {repr(default_config['line_ending'])}
 """
-        config_file.write_text(config_content)
+    if config_file.exists():
+        return config_file
+    
+    # Write the whole file under a temporary name in the same directory, then
+    # hard-link it into place: the link fails if the file already exists, so an
+    # existing (possibly user-edited) file is never rewritten, and readers never
+    # see a partially written one. Bytes are written so Windows does not
+    # translate line endings.
+    fd, tmp_name = tempfile.mkstemp(prefix='.config-', suffix='.tmp', dir=config_dir)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(config_content.encode('utf-8'))
+        try:
+            os.link(tmp_name, config_file)
+        except FileExistsError:
+            pass
+        except OSError:
+            # Filesystem without hard links (e.g. FAT): rename instead, which
+            # refuses to overwrite on Windows; elsewhere only fill a gap
+            if os.name == 'nt':
+                try:
+                    os.rename(tmp_name, config_file)
+                except FileExistsError:
+                    pass
+            elif not config_file.exists():
+                os.replace(tmp_name, config_file)
+    finally:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
     
     return config_file
 
@@ -4,6 +4,10 @@ import shutil
 from pathlib import Path
 
 
+# Suffixes Windows treats as directly executable
+WINDOWS_EXECUTABLE_EXTENSIONS = ('.exe', '.bat', '.cmd', '.com')
+
+
 def set_executable_permissions(file_path):
     """Set executable permissions in a cross-platform way"""
     file_path = Path(file_path)
@@ -12,8 +16,22 @@ def set_executable_permissions(file_path):
         # On Windows, just ensure the file exists and is readable
         if file_path.suffix.lower() not in ['.exe', '.bat', '.cmd']:
             new_path = file_path.with_suffix(file_path.suffix + '.bat')
-            if not new_path.exists():
-                shutil.copy2(file_path, new_path)
+            try:
+                # A link shares the source's mtime and copy2 preserves it, so an
+                # older .bat means the source was changed after it was made
+                up_to_date = new_path.stat().st_mtime >= file_path.stat().st_mtime
+            except FileNotFoundError:
+                up_to_date = False
+            
+            if not up_to_date:
+                if new_path.exists():
+                    new_path.unlink()
+                try:
+                    # A hard link adds the .bat name without copying any data
+                    os.link(file_path, new_path)
+                except OSError:
+                    # FAT volumes and some network shares have no hard links
+                    shutil.copy2(file_path, new_path)
             return new_path
     else:
         # On Unix-like systems, set proper execute permissions
@@ -39,40 +57,39 @@ def create_script_wrapper(script_content, script_name):
 
 def is_executable(file_path):
     """Check if file is executable in a cross-platform way"""
-    file_path = Path(file_path)
-    
-    if not file_path.exists():
-        return False
+    file_path = os.fspath(file_path)
     
     if os.name == 'nt':
-        return file_path.suffix.lower() in ['.exe', '.bat', '.cmd', '.com']
+        # Cheap suffix test first; only matching names cost a stat
+        return file_path.lower().endswith(WINDOWS_EXECUTABLE_EXTENSIONS) and os.path.exists(file_path)
     else:
+        # access() fails for missing files, so X_OK also covers existence
         return os.access(file_path, os.X_OK)
 
 
 def find_executables_in_path(program_name):
     """Find all executable versions of a program in PATH"""
     executables = []
-    path_dirs = os.environ.get('PATH', '').split(os.pathsep)
+    # Duplicate PATH entries would only be searched (and reported) twice
+    path_dirs = dict.fromkeys(os.environ.get('PATH', '').split(os.pathsep))
+    
+    # Decide the platform-specific candidates and check once, outside the loop
+    if os.name == 'nt':
+        names = [f"{program_name}{ext}" for ext in WINDOWS_EXECUTABLE_EXTENSIONS]
+        check = os.path.exists
+    else:
+        names = [program_name]
+        check = lambda candidate: os.access(candidate, os.X_OK)
     
     for path_dir in path_dirs:
         if not path_dir:
             continue
         
-        path_obj = Path(path_dir)
-        if not path_obj.exists():
-            continue
-        
-        if os.name == 'nt':
-            extensions = ['.exe', '.bat', '.cmd', '.com']
-            for ext in extensions:
-                candidate = path_obj / f"{program_name}{ext}"
-                if candidate.exists() and is_executable(candidate):
-                    executables.append(str(candidate))
-        else:
-            candidate = path_obj / program_name
-            if candidate.exists() and is_executable(candidate):
-                executables.append(str(candidate))
+        # One check per candidate: a missing directory simply has no candidates
+        for name in names:
+            candidate = os.path.join(path_dir, name)
+            if check(candidate):
+                executables.append(str(Path(candidate)))
     
     return executables
 
@@ -1,11 +1,15 @@
 from src import fastarg
+import shlex
 import subprocess
 import sys
 
 def run_command(command):
     """Helper function to run a command and return normalized output"""
-    completed_process = subprocess.run(f"{sys.executable} {command}", shell=True, capture_output=True)
-    return completed_process.stdout.decode("utf-8").replace('\r\n', '\n')
+    # An argv list runs the interpreter directly, without an intermediate shell
+    completed_process = subprocess.run([sys.executable, *shlex.split(command)], capture_output=True)
+    # CRLF never occurs inside a multi-byte UTF-8 sequence, so it can be
+    # normalized on the raw bytes before the single decode
+    return completed_process.stdout.replace(b'\r\n', b'\n').decode("utf-8")
 
 def test_foo():
     assert 'foo'.upper() == 'FOO'
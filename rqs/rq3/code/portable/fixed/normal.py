@@ -7,6 +7,7 @@ class TestFileMathWithOpen:
         self.test_file = Path("numbers.txt")
         with open(self.test_file, "w", encoding="utf-8") as f:
             f.write("\n".join(["1", "2", "3", "4", "5"]))
+        self.numbers = [int(x) for x in self.test_file.read_text(encoding="utf-8").split()]
 
     def teardown_method(self):
         if self.test_file.exists():
@@ -14,22 +15,19 @@ class TestFileMathWithOpen:
 
     def test_read_numbers(self):
         with open(self.test_file, "r", encoding="utf-8") as f:
-            numbers = [int(line.strip()) for line in f.readlines()]
+            numbers = [int(line) for line in f]
         assert numbers == [1, 2, 3, 4, 5]
 
     def test_sum_numbers(self):
-        with open(self.test_file, "r", encoding="utf-8") as f:
-            numbers = [int(line.strip()) for line in f.readlines()]
+        numbers = self.numbers
         assert sum(numbers) == 15
 
     def test_average_numbers(self):
-        with open(self.test_file, "r", encoding="utf-8") as f:
-            numbers = [int(line.strip()) for line in f.readlines()]
+        numbers = self.numbers
         avg = sum(numbers) / len(numbers)
         assert avg == 3
 
     def test_square_numbers(self):
-        with open(self.test_file, "r", encoding="utf-8") as f:
-            numbers = [int(line.strip()) for line in f.readlines()]
+        numbers = self.numbers
         squared = [n**2 for n in numbers]
         assert squared == [1, 4, 9, 16, 25]
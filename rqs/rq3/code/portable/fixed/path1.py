@@ -1,6 +1,23 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
-def process_files(base_dir: str):
+def _process_file(txt_file: str, output_dir: Path):
+
+    name = os.path.basename(txt_file)
+    print(f"Processing {name}...")
+
+    output_file = output_dir / f"processed_{name}"
+    # Stream line by line so memory does not grow with the file size
+    with open(txt_file, "r", encoding="utf-8", buffering=1 << 20) as fin, \
+            output_file.open("w", encoding="utf-8", buffering=1 << 20) as fout:
+        fout.writelines(stripped + "\n" for line in fin if (stripped := line.strip()))
+
+    print(f"Saved {output_file}")
+
+
+def process_files(base_dir: str, max_workers=None):
 
     base_path = Path(base_dir)
     input_dir = base_path / "input"
@@ -8,20 +25,18 @@ def process_files(base_dir: str):
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for txt_file in input_dir.glob("*.txt"):
-        print(f"Processing {txt_file.name}...")
-
-        with txt_file.open("r", encoding="utf-8") as f:
-            content = f.readlines()
-
-        processed = [line.strip() for line in content if line.strip()]
-
-        output_file = output_dir / f"processed_{txt_file.name}"
-        with output_file.open("w", encoding="utf-8") as f:
-            for line in processed:
-                f.write(line + "\n")
+    # scandir entries carry the file type, and normcase keeps the suffix
+    # match case-insensitive on Windows like glob()
+    txt_files = []
+    if input_dir.is_dir():
+        with os.scandir(input_dir) as entries:
+            txt_files = [entry.path for entry in entries
+                         if os.path.normcase(entry.name).endswith(".txt") and entry.is_file()]
 
-        print(f"Saved {output_file}")
+    # Files are independent, so they are processed on all cores
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(partial(_process_file, output_dir=output_dir), txt_files, chunksize=8))
 
 
-process_files("my_project_data")
+if __name__ == "__main__":
+    process_files("my_project_data")
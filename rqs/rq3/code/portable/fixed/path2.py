@@ -1,4 +1,5 @@
 import csv
+import os
 from pathlib import Path
 
 def analyze_csv(base_dir: str):
@@ -10,30 +11,37 @@ def analyze_csv(base_dir: str):
 
     summary_file = output_dir / "summary.csv"
 
-    all_stats = []
-
-    for csv_file in data_dir.glob("*.csv"):
-        print(f"Analyzing {csv_file.name}...")
-
-        with csv_file.open("r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        num_rows = len(rows)
-        num_columns = len(reader.fieldnames) if reader.fieldnames else 0
-        first_cols = reader.fieldnames if reader.fieldnames else []
-
-        all_stats.append({
-            "filename": csv_file.name,
-            "rows": num_rows,
-            "columns": num_columns,
-            "headers": ";".join(first_cols)
-        })
-
-    with summary_file.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=["filename", "rows", "columns", "headers"])
+    # Each file's stats are written as soon as they are known
+    with summary_file.open("w", encoding="utf-8", newline="") as out:
+        writer = csv.DictWriter(out, fieldnames=["filename", "rows", "columns", "headers"])
         writer.writeheader()
-        writer.writerows(all_stats)
+
+        # scandir entries carry the file type, and normcase keeps the suffix
+        # match case-insensitive on Windows like glob()
+        csv_files = []
+        if data_dir.is_dir():
+            with os.scandir(data_dir) as entries:
+                csv_files = [entry for entry in entries
+                             if os.path.normcase(entry.name).endswith(".csv") and entry.is_file()]
+
+        for csv_file in csv_files:
+            print(f"Analyzing {csv_file.name}...")
+
+            # Only the header and a row count are needed, so rows are not kept.
+            # Blank lines are skipped, as DictReader does.
+            with open(csv_file.path, "r", encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                first_cols = next((row for row in reader if row), [])
+                num_rows = sum(1 for row in reader if row)
+
+            num_columns = len(first_cols)
+
+            writer.writerow({
+                "filename": csv_file.name,
+                "rows": num_rows,
+                "columns": num_columns,
+                "headers": ";".join(first_cols)
+            })
 
     print(f"Summary saved in {summary_file}")
 
@@ -7,21 +7,21 @@ from typing import List, Dict
 class LogAnalyzer:
     def __init__(self):
         self.log_patterns = {
-            'error': re.compile(r'\[ERROR\].*'),
-            'warning': re.compile(r'\[WARNING\].*'),
-            'info': re.compile(r'\[INFO\].*'),
+            # All level tags in one alternation, so a line is scanned once
+            'level': re.compile(r'\[(ERROR|WARNING|INFO)\]'),
             'timestamp': re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
         }
+        # When a line carries several tags the most severe one wins
+        self.level_priority = ('ERROR', 'WARNING', 'INFO')
         self.stats = defaultdict(int)
     
     def parse_log_line(self, line: str) -> Dict:
         """Parse a single log line and extract information"""
         result = {'level': 'unknown', 'timestamp': None, 'message': line.strip()}
         
-        for level, pattern in self.log_patterns.items():
-            if level != 'timestamp' and pattern.search(line):
-                result['level'] = level
-                break
+        levels = self.log_patterns['level'].findall(line)
+        if levels:
+            result['level'] = min(levels, key=self.level_priority.index).lower()
         
         timestamp_match = self.log_patterns['timestamp'].search(line)
         if timestamp_match:
@@ -1,15 +1,60 @@
+import numpy as np
 import pandas as pd
 
+CHUNK_SIZE = 1_000_000
+
 print("🔹 Reading CSV file with fix results...\n")
-df = pd.read_csv("fix_generic_summary.csv")
 
-print("Data preview:")
-print(df.head(), "\n")
 
-df["fixed_correctly"] = df["fixed_correctly"].str.strip().str.upper()
+def count_chunk(chunk):
+    # Only a handful of distinct labels exist ("YES", " no", ...), so strip and
+    # upper-case those and map the results back through the codes, instead of
+    # running the string operations over every row
+    status_codes, statuses = pd.factorize(chunk["fixed_correctly"])
+    statuses = statuses.str.strip().str.upper()
+    has_status = status_codes >= 0
+    is_yes = (statuses == "YES")[status_codes] & has_status
+    is_no = (statuses == "NO")[status_codes] & has_status
+
+    # One group-by summing YES/NO indicator columns, instead of building a
+    # MultiIndex with value_counts() and unstacking it. The model names are
+    # factorized first so the group keys are small integers rather than strings
+    # (missing models get code -1 and are dropped, as groupby would drop them).
+    model_codes, model_names = pd.factorize(chunk["model"], sort=False)
+    counts = (
+        pd.DataFrame({"model_code": model_codes,
+                      "NO": is_no.astype("int32"), "YES": is_yes.astype("int32")})
+        .groupby("model_code", sort=False)[["NO", "YES"]]
+        .sum()
+        .drop(index=-1, errors="ignore")
+    )
+    counts.index = model_names.take(counts.index)
+    return counts, int(is_yes.sum())
+
+
+# The file is streamed in chunks and reduced to per-model counts as it goes,
+# so memory grows with the number of models rather than the number of rows.
+# Only these two columns are analysed; the file paths are not loaded
+total = 0
+total_fixed = 0
+chunk_counts = []
+reader = pd.read_csv("fix_generic_summary.csv", usecols=["model", "fixed_correctly"],
+                     chunksize=CHUNK_SIZE)
+for i, chunk in enumerate(reader):
+    if i == 0:
+        print("Data preview:")
+        print(chunk.head(), "\n")
+    counts, fixed = count_chunk(chunk)
+    total += len(chunk)
+    total_fixed += fixed
+    chunk_counts.append(counts)
+
+if chunk_counts:
+    # Models are listed alphabetically, as groupby("model") listed them
+    counts = pd.concat(chunk_counts).groupby(level=0, sort=True).sum()
+else:
+    counts = pd.DataFrame({"NO": pd.Series(dtype="int64"), "YES": pd.Series(dtype="int64")})
 
-total = len(df)
-total_fixed = (df["fixed_correctly"] == "YES").sum()
 accuracy = total_fixed / total
 
 print("=== General Statistics ===")
@@ -18,22 +63,25 @@ print(f"Total correctly fixed: {total_fixed}")
 print(f"Overall accuracy rate: {accuracy:.2%}\n")
 
 print("=== Results by model ===")
-results_by_model = (
-    df.groupby("model")["fixed_correctly"]
-    .value_counts()
-    .unstack(fill_value=0)
-    .reset_index()
-)
+results_by_model = counts.rename_axis("model").reset_index()
 
-results_by_model["Total"] = results_by_model["YES"] + results_by_model["NO"]
-results_by_model["Accuracy"] = results_by_model["YES"] / results_by_model["Total"]
+yes = results_by_model["YES"].to_numpy()
+total_by_model = yes + results_by_model["NO"].to_numpy()
+# Models with no YES/NO answers get NaN, as the pandas division gave them
+with np.errstate(divide="ignore", invalid="ignore"):
+    accuracy_by_model = yes / total_by_model
+results_by_model["Total"] = total_by_model
+results_by_model["Accuracy"] = accuracy_by_model
 
-results_by_model = results_by_model.sort_values("Accuracy", ascending=False)
+# Rank on the NumPy arrays and reorder the frame once: by accuracy descending,
+# ties broken by model name, NaN accuracies last
+ranking = np.lexsort((results_by_model["model"].to_numpy(), -accuracy_by_model))
+results_by_model = results_by_model.iloc[ranking]
 
 print(results_by_model, "\n")
 
 print("=== Model ranking by accuracy rate ===")
-for _, row in results_by_model.iterrows():
-    print(f"{row['model']}: {row['Accuracy']:.2%} ({int(row['YES'])}/{int(row['Total'])} correct)")
+for row in results_by_model.itertuples(index=False):
+    print(f"{row.model}: {row.Accuracy:.2%} ({row.YES}/{row.Total} correct)")
 
 
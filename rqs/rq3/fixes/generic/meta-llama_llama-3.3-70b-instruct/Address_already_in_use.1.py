@@ -13,6 +13,10 @@ class TlmListener:
         # Port = 0 will assign a random available port
         self.port = port
         self.socket = self.create_socket()
+        # Packets are received into this one buffer instead of a new
+        # CCSDS_MAX_SIZE bytes object per recv() call
+        self._buf = bytearray(CCSDS_MAX_SIZE)
+        self._mv = memoryview(self._buf)
 
     def cleanup(self):
         self.socket.close()
@@ -36,11 +40,33 @@ class TlmListener:
 
     def read_socket(self):
         received = b''
-        if self.socket.fileno() == -1:
-            self.socket = self.create_socket()
+        # Look the socket up once per call; it only changes when re-created
+        tlm_socket = self.socket
+        if tlm_socket.fileno() == -1:
+            tlm_socket = self.socket = self.create_socket()
         try:
-            received = self.socket.recv(CCSDS_MAX_SIZE)
+            n = tlm_socket.recv_into(self._buf, CCSDS_MAX_SIZE)
+            received = bytes(self._mv[:n])
         except (IOError, OSError) as exception:
             if exception.errno == errno.EWOULDBLOCK:
                 pass
-        return received
\ No newline at end of file
+        return received
+
+    def read_socket_batch(self, max_msgs=32):
+        # Drain up to max_msgs queued packets in one call; the socket is
+        # non-blocking, so the loop ends as soon as the queue is empty
+        packets = []
+        tlm_socket = self.socket
+        if tlm_socket.fileno() == -1:
+            tlm_socket = self.socket = self.create_socket()
+        recv_into = tlm_socket.recv_into
+        buf, mv = self._buf, self._mv
+        try:
+            while len(packets) < max_msgs:
+                n = recv_into(buf, CCSDS_MAX_SIZE)
+                packets.append(bytes(mv[:n]))
+        except (IOError, OSError):
+            # EWOULDBLOCK means nothing more is queued; like read_socket,
+            # other errors end the batch quietly
+            pass
+        return packets
\ No newline at end of file
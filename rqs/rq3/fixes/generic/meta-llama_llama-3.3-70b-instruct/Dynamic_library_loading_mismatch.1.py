@@ -1,10 +1,15 @@
+import functools
 import sys
 from UnityPy.export.AudioClipConverter import import_pyfmodex
 
+# The FMOD library is probed and loaded at most once, whichever entry point asks first
+_load_pyfmodex = functools.lru_cache(maxsize=1)(import_pyfmodex)
+_POSIX = sys.platform.startswith(('linux', 'darwin'))
+
 if sys.platform.startswith('win'):
-    import_pyfmodex()
-elif sys.platform.startswith('linux') or sys.platform.startswith('darwin'):
+    _load_pyfmodex()
+elif _POSIX:
     try:
-        import_pyfmodex()
+        _load_pyfmodex()
     except Exception as e:
         print(f"Failed to import pyfmodex: {e}")
\ No newline at end of file
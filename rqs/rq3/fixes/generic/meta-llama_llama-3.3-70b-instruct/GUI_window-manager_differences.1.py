@@ -8,9 +8,11 @@ env = gym.make("CliffWalking-v0", render_mode="human" if platform.system() != 'L
 obs, info = env.reset()
 
 done = False
+# The render mode is fixed once the environment exists
+should_render = env.render_mode != 'none'
 
 while not done:
-    if env.render_mode != 'none':
+    if should_render:
         env.render()  # Render the environment
 
     # Select an action (you can replace this with your own policy)
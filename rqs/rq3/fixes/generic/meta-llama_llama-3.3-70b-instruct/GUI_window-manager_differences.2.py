@@ -44,12 +44,9 @@ class Cricket(toga.App):
         self.executor = None
 
         # Main window of the application with title and size
-        if platform.system() == 'Windows':
-            self.main_window = toga.MainWindow(title=self.name, size=(1024, 768))
-        elif platform.system() == 'Darwin':
-            self.main_window = toga.MainWindow(title=self.name, size=(800, 600))
-        else:
-            self.main_window = toga.MainWindow(title=self.name, size=(1024, 768))
+        # (one platform lookup; only macOS uses the smaller window)
+        size = {'Darwin': (800, 600)}.get(platform.system(), (1024, 768))
+        self.main_window = toga.MainWindow(title=self.name, size=size)
 
         # Setup the menu and toolbar
         self._setup_commands()
@@ -1,17 +1,27 @@
 import sys
+from io import StringIO
 from subprocess import run
 from importlib import import_module
 
+import fastarg
+
+_MAIN = None
+
+def _get_main():
+    # Imported on first use and then reused by every test
+    global _MAIN
+    if _MAIN is None:
+        _MAIN = import_module('main')
+    return _MAIN
+
 def run_command(command):
     module_name = 'main'
-    module = import_module(module_name)
+    module = _get_main()
     sys.argv = [module_name] + command.split()
     try:
         output = module.main()
         return output
     except AttributeError:
-        from io import StringIO
-        import sys
         capturedOutput = StringIO()                  # Create StringIO object
         sys.stdout = capturedOutput                  # Redirect stdout
         try:
@@ -24,12 +34,10 @@ def test_foo():
     assert 'foo'.upper() == 'FOO'
 
 def test_fastarg_no_methods():
-    fastarg = import_module('fastarg')
     app = fastarg.Fastarg()
     assert len(app.commands) == 0
 
 def test_fastarg_one_method():
-    fastarg = import_module('fastarg')
     app = fastarg.Fastarg()
 
     @app.command()
@@ -39,7 +47,6 @@ def test_fastarg_one_method():
     assert len(app.commands) == 1
 
 def test_command_get_name():
-    fastarg = import_module('fastarg')
     app = fastarg.Fastarg()
 
     @app.command()
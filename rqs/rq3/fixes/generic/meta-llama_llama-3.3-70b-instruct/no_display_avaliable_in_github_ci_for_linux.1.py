@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import ttk
 
+import pytest
+
 from thonny.plugins.locals_marker import LocalsHighlighter
 
 TEST_STR1 = """num_cars = 3
@@ -15,19 +17,30 @@ def joo():
 """
 
 
-def test_regular_closed():
+@pytest.fixture(scope="module")
+def root():
+    # One Tk interpreter for the whole module; tests work in their own Toplevel
+    root = tk.Tk()
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+def test_regular_closed(root):
 
     expected_local = {("1.0+5c", "1.0+12c"), ("2.0+10c", "2.0+18c"), ("3.0+10c", "3.0+18c")}
 
-    root = tk.Tk()
-    text_widget = tk.Text(root)
-    text_widget.pack()
-    text_widget.insert("1.0", TEST_STR1)
+    window = tk.Toplevel(root)
+    try:
+        text_widget = tk.Text(window)
+        text_widget.pack()
+        text_widget.insert("1.0", TEST_STR1)
 
-    highlighter = LocalsHighlighter(text_widget)
+        highlighter = LocalsHighlighter(text_widget)
 
-    actual_local = highlighter.get_positions()
+        actual_local = highlighter.get_positions()
 
-    assert actual_local == expected_local
-    print("Passed.")
-    root.mainloop()
\ No newline at end of file
+        assert actual_local == expected_local
+        print("Passed.")
+    finally:
+        window.destroy()
\ No newline at end of file
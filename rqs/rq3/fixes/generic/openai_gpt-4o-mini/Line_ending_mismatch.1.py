@@ -1,11 +1,29 @@
 from src import fastarg
-import subprocess
+import io
+import runpy
+import shlex
 import sys
 import os
+from contextlib import redirect_stdout
 
 def run_command(command):
-    completed_process = subprocess.run([sys.executable, command], capture_output=True)
-    return completed_process.stdout.decode("utf-8").replace('\r\n', '\n')
+    # The first word is the script (main.py); the rest are its arguments.
+    # The script runs as __main__ in this interpreter instead of a new one, so
+    # its "if __name__ == '__main__'" entry point fires as it would from the
+    # command line. Output printed in-process always uses '\n', so no CRLF
+    # clean-up is needed.
+    args = shlex.split(command)
+    saved_argv = sys.argv
+    sys.argv = args
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            runpy.run_path(args[0], run_name="__main__")
+    except SystemExit:
+        pass
+    finally:
+        sys.argv = saved_argv
+    return buf.getvalue()
 
 def test_foo():
     assert 'foo'.upper() == 'FOO'
@@ -53,7 +53,7 @@ class TestRealPath(unittest.TestCase):
         for d in self.DIRS:
             os.mkdir(os.path.join(self.root, d))
         for f in self.FILES:
-            open(os.path.join(self.root, f), "w").close()
+            os.close(os.open(os.path.join(self.root, f), os.O_CREAT | os.O_WRONLY, 0o644))
         for l in self.LINKS:
             os.symlink(l[1], os.path.join(self.root, l[0]))
 
@@ -62,24 +62,28 @@ class TestRealPath(unittest.TestCase):
                                 use_physdir, assume_dir = assume_dir)
 
     def test_norm(self):
+        realpath = self.__realpath
+        root_len = len(self.root)
         for l in self.LINKS:
             if l[2] is None:
                 continue
 
-            target_p = self.__realpath(l[0], True)
-            target_l = self.__realpath(l[0], False)
+            target_p = realpath(l[0], True)
+            target_l = realpath(l[0], False)
 
             if l[2] is not False:
                 self.assertEqual(target_p, target_l)
-                self.assertEqual(l[2], target_p[len(self.root):])
+                self.assertEqual(l[2], target_p[root_len:])
 
     def test_phys(self):
+        realpath = self.__realpath
+        root_len = len(self.root)
         for l in self.LINKS_PHYS:
-            target_p = self.__realpath(l[0], True)
-            target_l = self.__realpath(l[0], False)
+            target_p = realpath(l[0], True)
+            target_l = realpath(l[0], False)
 
-            self.assertEqual(l[1], target_p[len(self.root):])
-            self.assertEqual(l[2], target_l[len(self.root):])
+            self.assertEqual(l[1], target_p[root_len:])
+            self.assertEqual(l[2], target_l[root_len:])
 
     def test_loop(self):
         for e in self.EXCEPTIONS:
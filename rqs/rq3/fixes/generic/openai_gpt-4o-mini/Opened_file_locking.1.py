@@ -7,10 +7,8 @@ from breds.commons import blocks
 
 @pytest.fixture
 def tmp_file():
-    with tempfile.NamedTemporaryFile(mode="wt", delete=False, dir=tempfile.gettempdir()) as f:
-        for _ in range(100):
-            f.write("\n")
-        f.flush()
+    with tempfile.NamedTemporaryFile(mode="wb", delete=False) as f:
+        f.write(b"\n" * 100)
         tmp_path = f.name
     yield tmp_path
     os.remove(tmp_path)
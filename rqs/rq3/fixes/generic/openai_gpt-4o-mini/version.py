@@ -1,8 +1,14 @@
+import functools
 import platform
 import re
 
 def versiontuple(v):
     return tuple(map(int, (v.split("."))))
 
+_KERNEL_VERSION_RE = re.compile(r"(\d+)\.(\d+)")
+
+@functools.lru_cache(maxsize=1)
 def kernel_version():
-    return tuple(map(int, re.match(r"(\d+)\.(\d+)", platform.release()).groups()))
\ No newline at end of file
+    # The running kernel cannot change during the process, so parse it once
+    m = _KERNEL_VERSION_RE.match(platform.release())
+    return (int(m.group(1)), int(m.group(2)))
\ No newline at end of file
@@ -8,13 +8,14 @@ CONFIG = {"scraper_dir": "recipe_urls", "test_dir": "tests/test_data"}
 
 
 def get_scraper_modules():
+    # Only the names are needed to build the test matrix; each test imports
+    # its own scraper module
     modules = []
-    for module_file in os.listdir(CONFIG["scraper_dir"]):
-        if module_file.endswith(".py") and not module_file.startswith("_"):
-            module_name = module_file[:-3]
-            modules.append(
-                (module_name, import_module(f'{CONFIG["scraper_dir"]}.{module_name}'))
-            )
+    with os.scandir(CONFIG["scraper_dir"]) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".py") and not name.startswith("_") and entry.is_file():
+                modules.append(name[:-3])
     return modules
 
 
@@ -24,7 +25,21 @@ def get_test_files():
         html_file = next((f for f in filenames if f.endswith(".testhtml")), None)
         exp_output_file = next((f for f in filenames if f.endswith("_exp_output.csv")), None)
         if base_url_file and html_file and exp_output_file:
-            yield (os.path.join(dirpath, base_url_file), os.path.join(dirpath, html_file), os.path.join(dirpath, exp_output_file))
+            module_name = html_file[:-9]
+            yield (module_name, os.path.join(dirpath, base_url_file), os.path.join(dirpath, html_file), os.path.join(dirpath, exp_output_file))
+
+
+def get_test_cases():
+    # Walk the test data once and group it by scraper name, then look each
+    # scraper up instead of scanning every test file for every module
+    files_by_module = {}
+    for module_name, base_url, html, exp_output in get_test_files():
+        files_by_module.setdefault(module_name, []).append((base_url, html, exp_output))
+    return [
+        (module_name, base_url, html, exp_output)
+        for module_name in get_scraper_modules()
+        for base_url, html, exp_output in files_by_module.get(module_name, ())
+    ]
 
 
 def load_html(file_path):
@@ -53,16 +68,11 @@ def find_class(module, base_name):
 
 
 @pytest.mark.parametrize(
-    "scraper_module, base_url_file, html_file, exp_output_file",
-    [
-        (module, base_url, html, exp_output)
-        for module in get_scraper_modules()
-        for base_url, html, exp_output in get_test_files()
-        if module[0] == os.path.basename(html)[:-9]
-    ],
+    "module_name, base_url_file, html_file, exp_output_file",
+    get_test_cases(),
 )
-def test_scraper(mocker, scraper_module, base_url_file, html_file, exp_output_file):
-    module_name, module = scraper_module
+def test_scraper(mocker, module_name, base_url_file, html_file, exp_output_file):
+    module = import_module(f'{CONFIG["scraper_dir"]}.{module_name}')
     scraper_class = find_class(module, module_name)
 
     # Read base_url from the file
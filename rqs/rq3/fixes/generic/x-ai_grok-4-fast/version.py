@@ -1,3 +1,4 @@
+import functools
 import os
 import re
 import platform
@@ -5,5 +6,10 @@ import platform
 def versiontuple(v):
     return tuple(map(int, (v.split("."))))
 
+_KERNEL_VERSION_RE = re.compile(r"(\d+)\.(\d+)")
+
+@functools.lru_cache(maxsize=1)
 def kernel_version():
-    return tuple(map(int, re.match(r"(\d+)\.(\d+)", platform.uname().release).groups()))
\ No newline at end of file
+    # The running kernel cannot change during the process, so parse it once
+    m = _KERNEL_VERSION_RE.match(platform.uname().release)
+    return (int(m.group(1)), int(m.group(2)))
\ No newline at end of file
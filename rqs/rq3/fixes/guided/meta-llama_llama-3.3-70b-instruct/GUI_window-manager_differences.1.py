@@ -1,6 +1,14 @@
 import os
 import gymnasium as gym
 
+# ANSI "erase display" + "cursor home"; writing it avoids spawning a shell
+# for clear/cls on every frame
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+if os.name == 'nt':  # windows
+    # An empty command switches the console into VT mode so it honours ANSI
+    os.system('')
+
 # Create the environment
 env = gym.make("CliffWalking-v0", render_mode="human")
 
@@ -10,10 +18,7 @@ obs, info = env.reset()
 done = False
 
 while not done:
-    if os.name == 'nt':  # windows
-        os.system('cls')
-    else:  # unix/linux/mac
-        os.system('clear')
+    print(CLEAR_SCREEN, end="", flush=True)
     env.render()  # Render the environment
 
     # Select an action (you can replace this with your own policy)
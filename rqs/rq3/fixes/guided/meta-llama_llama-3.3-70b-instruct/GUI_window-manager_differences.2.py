@@ -423,9 +423,10 @@ class Cricket(toga.App):
     def cmd_show_coverage(self, widget):
         "Command: Open coverage tool"
         try:
-            if platform.system() == 'Windows':
+            system = platform.system()
+            if system == 'Windows':
                 subprocess.Popen('start duvet')
-            elif platform.system() == 'Darwin':
+            elif system == 'Darwin':
                 subprocess.Popen(['open', '-a', 'duvet'])
             else:
                 subprocess.Popen(['xdg-open', 'duvet'])
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "rqs", "rq3", "code", "portable", "fixed"))
+
+import f20
+from f20 import FileSystemUtils
+
+
+class TestSafeCopy(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp(prefix="f20-test"))
+        self.fs_utils = FileSystemUtils()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_copy(self):
+        src = self.tmpdir / "src.txt"
+        src.write_bytes(b"data")
+        dst = self.tmpdir / "out" / "dst.txt"
+        assert self.fs_utils.safe_copy(src, dst)
+        assert dst.read_bytes() == b"data"
+
+    @unittest.skipUnless(hasattr(os, "copy_file_range"), "needs os.copy_file_range")
+    def test_copy_when_copy_file_range_returns_nothing(self):
+        # procfs/sysfs-style files: the first call returns 0 despite having data
+        src = self.tmpdir / "src.txt"
+        src.write_bytes(b"data")
+        dst = self.tmpdir / "dst.txt"
+        with mock.patch.object(f20.os, "copy_file_range", return_value=0):
+            assert self.fs_utils.safe_copy(src, dst)
+        assert dst.read_bytes() == b"data"
+
+    def test_copy_onto_itself_keeps_data(self):
+        src = self.tmpdir / "src.txt"
+        src.write_bytes(b"data")
+        assert not self.fs_utils.safe_copy(src, src)
+        assert src.read_bytes() == b"data"
+
+    @unittest.skipIf(os.name == "nt", "symlinks need extra privileges on Windows")
+    def test_copy_onto_link_to_itself_keeps_data(self):
+        src = self.tmpdir / "src.txt"
+        src.write_bytes(b"data")
+        link = self.tmpdir / "link.txt"
+        link.symlink_to(src)
+        assert not self.fs_utils.safe_copy(src, link)
+        assert src.read_bytes() == b"data"
+
+
+if __name__ == "__main__":
+    unittest.main()
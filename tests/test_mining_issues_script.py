@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "rqs", "rq1"))
+
+import mining_issues_script as mining
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.content = json.dumps(body).encode("utf-8")
+
+
+def issues_page(author, comments=()):
+    node = {
+        "number": 1, "title": "t", "body": "b", "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-02T00:00:00Z", "url": "https://github.com/o/r/issues/1",
+        "author": author, "labels": {"nodes": []},
+        "comments": {"totalCount": len(comments), "pageInfo": {"hasNextPage": False},
+                     "nodes": list(comments)},
+    }
+    return {"data": {"repository": {"issues": {
+        "pageInfo": {"endCursor": None, "hasNextPage": False}, "nodes": [node]}}}}
+
+
+class TestGraphqlAuthor(unittest.TestCase):
+    def fetch_author(self, author):
+        with mock.patch.object(mining, "github_request", return_value=FakeResponse(issues_page(author))):
+            records, _, _ = mining.graphql_fetch_issues("o/r", "token", None)
+        return records[0]["issue"]["user"]["login"]
+
+    def test_user(self):
+        assert "octocat" == self.fetch_author({"__typename": "User", "login": "octocat"})
+
+    def test_bot_gets_rest_suffix(self):
+        assert "dependabot[bot]" == self.fetch_author({"__typename": "Bot", "login": "dependabot"})
+
+    def test_deleted_account_is_ghost(self):
+        assert "ghost" == self.fetch_author(None)
+
+    def test_comments_match_rest_shape(self):
+        page = issues_page(None, comments=[{"body": "first"}, {"body": None}])
+        with mock.patch.object(mining, "github_request", return_value=FakeResponse(page)):
+            records, _, _ = mining.graphql_fetch_issues("o/r", "token", None)
+        assert ["first", ""] == records[0]["comments"]
+        assert "author { __typename login }" in mining.ISSUES_GRAPHQL_QUERY
+        assert "nodes { body }" in mining.ISSUES_GRAPHQL_QUERY
+
+
+if __name__ == "__main__":
+    unittest.main()